@@ -63,6 +63,27 @@ if __name__ == "__main__":
         default=8000,
         help="Port to bind the server to (default: 8000)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes (default: 1). Conversation memory is "
+            "in-process, so use more than one only with a checkpoint database "
+            "and sticky sessions"
+        ),
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        default=None,
+        help="Maximum concurrent connections per worker before returning 503",
+    )
+    parser.add_argument(
+        "--no-access-log",
+        action="store_true",
+        help="Disable the per-request access log",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -78,13 +99,23 @@ if __name__ == "__main__":
     if args.reload:
         reload = True
 
+    if reload and args.workers > 1:
+        parser.error("--reload cannot be combined with --workers > 1")
+
     try:
         logger.info(f"Starting DeepResearcch API server on {args.host}:{args.port}")
+        # uvicorn[standard] installs uvloop and httptools, which "auto" picks
+        # over asyncio/h11 (the fallback on platforms without uvloop)
         uvicorn.run(
             "src.server:app",
             host=args.host,
             port=args.port,
             reload=reload,
+            workers=args.workers,
+            loop="auto",
+            http="auto",
+            limit_concurrency=args.limit_concurrency,
+            access_log=not args.no_access_log,
             log_level=args.log_level,
         )
     except Exception as e:
@@ -37,8 +37,11 @@ Key Constants:
         - researcher: Information gathering and analysis specialist
         - coder: Programming and mathematical computation specialist
         
-    TEAM_MEMBERS: List of available team member types
+    TEAM_MEMBERS: Tuple of available team member types
     SELECTED_SEARCH_ENGINE: Currently configured search provider
+    SELECTED_RAG_PROVIDER: Configured RAG provider, or None when RAG is off
+        - Both are resolved to their enum (SearchEngine / RAGProvider) once at
+          import, so callers dispatch by identity instead of string compares
     BUILT_IN_QUESTIONS: Predefined research questions in multiple languages
 
 The package enables flexible configuration of the entire research workflow,
@@ -46,42 +49,51 @@ supporting different deployment scenarios, tool providers, and user preferences
 through environment variables and configuration files.
 """
 
-from dotenv import load_dotenv
+from types import MappingProxyType
 
-from .loader import load_yaml_config
-from .questions import BUILT_IN_QUESTIONS, BUILT_IN_QUESTIONS_ZH_CN
-from .tools import SELECTED_SEARCH_ENGINE, SearchEngine
+from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables once, before submodules read them at import time
 load_dotenv()
 
+from .loader import load_yaml_config  # noqa: E402
+from .questions import BUILT_IN_QUESTIONS, BUILT_IN_QUESTIONS_ZH_CN  # noqa: E402
+from .tools import (  # noqa: E402
+    SELECTED_RAG_PROVIDER,
+    SELECTED_SEARCH_ENGINE,
+    RAGProvider,
+    SearchEngine,
+)
+
 # Team configuration
-TEAM_MEMBER_CONFIGURATIONS = {
-    "researcher": {
-        "name": "researcher",
-        "desc": (
-            "Responsible for searching and collecting relevant information, understanding user needs and conducting research analysis"
-        ),
-        "desc_for_llm": (
-            "Uses search engines and web crawlers to gather information from the internet. "
-            "Outputs a Markdown report summarizing findings. Researcher can not do math or programming."
-        ),
-        "is_optional": False,
-    },
-    "coder": {
-        "name": "coder",
-        "desc": (
-            "Responsible for code implementation, debugging and optimization, handling technical programming tasks"
-        ),
-        "desc_for_llm": (
-            "Executes Python or Bash commands, performs mathematical calculations, and outputs a Markdown report. "
-            "Must be used for all mathematical computations."
-        ),
-        "is_optional": True,
-    },
-}
+TEAM_MEMBER_CONFIGURATIONS = MappingProxyType(
+    {
+        "researcher": {
+            "name": "researcher",
+            "desc": (
+                "Responsible for searching and collecting relevant information, understanding user needs and conducting research analysis"
+            ),
+            "desc_for_llm": (
+                "Uses search engines and web crawlers to gather information from the internet. "
+                "Outputs a Markdown report summarizing findings. Researcher can not do math or programming."
+            ),
+            "is_optional": False,
+        },
+        "coder": {
+            "name": "coder",
+            "desc": (
+                "Responsible for code implementation, debugging and optimization, handling technical programming tasks"
+            ),
+            "desc_for_llm": (
+                "Executes Python or Bash commands, performs mathematical calculations, and outputs a Markdown report. "
+                "Must be used for all mathematical computations."
+            ),
+            "is_optional": True,
+        },
+    }
+)
 
-TEAM_MEMBERS = list(TEAM_MEMBER_CONFIGURATIONS.keys())
+TEAM_MEMBERS = tuple(TEAM_MEMBER_CONFIGURATIONS)
 
 __all__ = [
     # Other configurations
@@ -89,6 +101,8 @@ __all__ = [
     "TEAM_MEMBER_CONFIGURATIONS",
     "SELECTED_SEARCH_ENGINE",
     "SearchEngine",
+    "SELECTED_RAG_PROVIDER",
+    "RAGProvider",
     "BUILT_IN_QUESTIONS",
     "BUILT_IN_QUESTIONS_ZH_CN",
     "load_yaml_config",
@@ -9,7 +9,8 @@ Types:
     LLMType: Literal type defining available LLM categories
     
 Constants:
-    AGENT_LLM_MAP: Dictionary mapping agent names to their optimal LLM types
+    COORDINATOR, PLANNER, RESEARCHER, ...: Interned agent name strings
+    AGENT_LLM_MAP: Read-only mapping of agent names to their optimal LLM types
 
 Agent categories include:
 - Planner: Strategic research planning (uses reasoning models)
@@ -18,20 +19,35 @@ Agent categories include:
 - Coder: Code analysis and generation (uses code-optimized models)
 """
 
-from typing import Literal
+import sys
+from types import MappingProxyType
+from typing import Literal, Mapping
 
 # Define available LLM types
 LLMType = Literal["basic", "reasoning", "vision", "code"]
 
+# Agent names, interned so lookups with dynamically built names compare by identity
+COORDINATOR = sys.intern("coordinator")
+PLANNER = sys.intern("planner")
+RESEARCHER = sys.intern("researcher")
+CODER = sys.intern("coder")
+REPORTER = sys.intern("reporter")
+PODCAST_SCRIPT_WRITER = sys.intern("podcast_script_writer")
+PPT_COMPOSER = sys.intern("ppt_composer")
+PROSE_WRITER = sys.intern("prose_writer")
+PROMPT_ENHANCER = sys.intern("prompt_enhancer")
+
 # Define agent-LLM mapping
-AGENT_LLM_MAP: dict[str, LLMType] = {
-    "coordinator": "basic",
-    "planner": "basic",
-    "researcher": "basic",
-    "coder": "basic",
-    "reporter": "basic",
-    "podcast_script_writer": "basic",
-    "ppt_composer": "basic",
-    "prose_writer": "basic",
-    "prompt_enhancer": "basic",
-}
+AGENT_LLM_MAP: Mapping[str, LLMType] = MappingProxyType(
+    {
+        COORDINATOR: "basic",
+        PLANNER: "basic",
+        RESEARCHER: "basic",
+        CODER: "basic",
+        REPORTER: "basic",
+        PODCAST_SCRIPT_WRITER: "basic",
+        PPT_COMPOSER: "basic",
+        PROSE_WRITER: "basic",
+        PROMPT_ENHANCER: "basic",
+    }
+)
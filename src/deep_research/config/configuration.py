@@ -11,6 +11,7 @@ Key Functions:
     get_str_env(name, default): Retrieves string environment variables with fallback defaults
     get_int_env(name, default): Parses integer environment variables with error handling
     get_recursion_limit(default): Gets workflow recursion limit with validation
+    refresh_env(): Clears the cached environment lookups after the environment changes
 
 Key Classes:
     Configuration: Dataclass holding all configurable workflow parameters
@@ -40,32 +41,36 @@ seamless parameter passing throughout the research workflow execution.
 import logging
 import os
 from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Any, Optional
 
 from langchain_core.runnables import RunnableConfig
 
-from src.deep_research.config.report_style import ReportStyle
+from src.deep_research.config.report_style import DEFAULT_REPORT_STYLE
 from src.deep_research.rag.retriever import Resource
 
 logger = logging.getLogger(__name__)
 
-_TRUTHY = {"1", "true", "yes", "y", "on"}
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
 
 
+@lru_cache(maxsize=256)
 def get_bool_env(name: str, default: bool = False) -> bool:
-    val = os.getenv(name)
+    val = os.environ.get(name)
     if val is None:
         return default
-    return str(val).strip().lower() in _TRUTHY
+    return val.strip().lower() in _TRUTHY
 
 
+@lru_cache(maxsize=256)
 def get_str_env(name: str, default: str = "") -> str:
-    val = os.getenv(name)
-    return default if val is None else str(val).strip()
+    val = os.environ.get(name)
+    return default if val is None else val.strip()
 
 
+@lru_cache(maxsize=256)
 def get_int_env(name: str, default: int = 0) -> int:
-    val = os.getenv(name)
+    val = os.environ.get(name)
     if val is None:
         return default
     try:
@@ -77,6 +82,13 @@ def get_int_env(name: str, default: int = 0) -> int:
         return default
 
 
+def refresh_env() -> None:
+    """Clear the cached environment lookups after the environment changes."""
+    get_bool_env.cache_clear()
+    get_str_env.cache_clear()
+    get_int_env.cache_clear()
+
+
 def get_recursion_limit(default: int = 25) -> int:
     """Get the recursion limit from environment variable or use default.
 
@@ -86,8 +98,16 @@ def get_recursion_limit(default: int = 25) -> int:
     Returns:
         int: The recursion limit to use
     """
-    env_value_str = get_str_env("AGENT_RECURSION_LIMIT", str(default))
-    parsed_limit = get_int_env("AGENT_RECURSION_LIMIT", default)
+    env_value_str = os.getenv("AGENT_RECURSION_LIMIT")
+    if env_value_str is None:
+        return default
+    try:
+        parsed_limit = int(env_value_str.strip())
+    except ValueError:
+        logger.warning(
+            f"Invalid integer value for AGENT_RECURSION_LIMIT: {env_value_str}. Using default {default}."
+        )
+        return default
 
     if parsed_limit > 0:
         logger.info(f"Recursion limit set to: {parsed_limit}")
@@ -100,7 +120,7 @@ def get_recursion_limit(default: int = 25) -> int:
         return default
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Configuration:
     """The configurable fields."""
 
@@ -110,8 +130,10 @@ class Configuration:
     max_plan_iterations: int = 1  # Maximum number of plan iterations
     max_step_num: int = 3  # Maximum number of steps in a plan
     max_search_results: int = 3  # Maximum number of search results
-    mcp_settings: dict = None  # MCP settings, including dynamic loaded tools
-    report_style: str = ReportStyle.ACADEMIC.value  # Report style
+    mcp_settings: dict = field(
+        default_factory=dict
+    )  # MCP settings, including dynamic loaded tools
+    report_style: str = DEFAULT_REPORT_STYLE  # Report style
     enable_deep_thinking: bool = False  # Whether to enable deep thinking
 
     @classmethod
@@ -122,9 +144,16 @@ class Configuration:
         configurable = (
             config["configurable"] if config and "configurable" in config else {}
         )
-        values: dict[str, Any] = {
-            f.name: os.environ.get(f.name.upper(), configurable.get(f.name))
-            for f in fields(cls)
-            if f.init
-        }
-        return cls(**{k: v for k, v in values.items() if v})
+        env = os.environ
+        values: dict[str, Any] = {}
+        for name, env_name in _CONFIGURATION_FIELDS:
+            value = env.get(env_name, configurable.get(name))
+            if value:
+                values[name] = value
+        return cls(**values)
+
+
+# (field name, env var name) pairs, resolved once instead of per call
+_CONFIGURATION_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    (f.name, f.name.upper()) for f in fields(Configuration) if f.init
+)
@@ -5,12 +5,10 @@ This module provides utilities for loading and processing YAML configuration fil
 with automatic environment variable substitution and caching capabilities.
 
 Key Functions:
-    replace_env_vars(value): Substitutes environment variables in string values
+    process_dict(config): Processes dictionaries in place for environment variable substitution
         - Supports $VARIABLE_NAME syntax for environment variable references
         - Falls back to variable name if environment variable not found
-        
-    process_dict(config): Recursively processes dictionaries for environment variable substitution
-        - Traverses nested dictionary structures
+        - Traverses nested dictionary and list structures iteratively
         - Applies environment variable replacement to string values
         - Preserves non-string values unchanged
         
@@ -20,11 +18,26 @@ Key Functions:
         - Caches processed configurations for performance
         - Returns empty dict if file doesn't exist
 
+    clear_config_cache(): Drops every cached configuration
+
+JSON Sidecar Cache:
+    - Opt-in via DEEP_RESEARCH_YAML_CACHE=1
+    - The parsed YAML is written next to it as <file>.cache.json, tagged with
+      the YAML file's mtime and size; later cold loads parse that JSON instead
+      when both still match
+    - Stores the YAML before $VAR substitution, so no environment values (API
+      keys) reach the disk and env changes still apply
+    - Files with values JSON can't round-trip (dates, non-string keys) are not
+      cached
+
 Features:
     - Environment Variable Substitution: Automatic $VAR replacement in YAML values
-    - Caching System: File-based caching to avoid repeated YAML parsing
+    - Caching System: mtime-aware caching to avoid repeated YAML parsing
+    - LibYAML Parsing: Uses yaml.CSafeLoader when PyYAML was built against
+      libyaml (HAS_LIBYAML), falling back to the pure-Python SafeLoader.
+      PyPI wheels bundle libyaml; source builds need the libyaml headers.
     - Error Handling: Graceful handling of missing files and invalid YAML
-    - Recursive Processing: Deep traversal of nested configuration structures
+    - Nested Processing: Deep traversal of nested configuration structures
 
 Usage:
     config = load_yaml_config("conf.yaml")
@@ -37,55 +50,153 @@ providing flexible configuration management with environment-specific overrides.
 
 # 
 
+import json
+import logging
 import os
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
-
-def replace_env_vars(value: str) -> str:
-    """Replace environment variables in string values."""
-    if not isinstance(value, str):
-        return value
-    if value.startswith("$"):
-        env_var = value[1:]
-        return os.getenv(env_var, env_var)
-    return value
+# Prefer the libyaml-backed C loader when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+
+    HAS_LIBYAML = True
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader
+
+    HAS_LIBYAML = False
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson comes in via langsmith but is not required
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Sidecar holding the parsed (not yet env-substituted) YAML as JSON
+_SIDECAR_SUFFIX = ".cache.json"
+
+
+def _sidecar_enabled() -> bool:
+    value = os.getenv("DEEP_RESEARCH_YAML_CACHE", "").lower()
+    return value in ("1", "true", "yes", "on")
+
+
+def _read_sidecar(file_path: str, st: os.stat_result) -> Optional[Any]:
+    try:
+        with open(file_path + _SIDECAR_SUFFIX, "rb") as f:
+            sidecar = _json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable YAML cache for {file_path}: {e}")
+        return None
+    # The sidecar records which version of the YAML file it was built from
+    if (
+        isinstance(sidecar, dict)
+        and sidecar.get("mtime_ns") == st.st_mtime_ns
+        and sidecar.get("size") == st.st_size
+    ):
+        return sidecar.get("config")
+    return None
+
+
+def _write_sidecar(file_path: str, st: os.stat_result, config: Any) -> None:
+    payload = _json_dumps(
+        {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "config": config}
+    )
+    # YAML values JSON can't represent faithfully (dates, non-string keys)
+    # would come back different, so such files are simply not cached.
+    if _json_loads(payload)["config"] != config:
+        return
+    path = file_path + _SIDECAR_SUFFIX
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write YAML cache {path}: {e}")
+
+
+def _parse_yaml(file_path: str, st: os.stat_result) -> Any:
+    use_sidecar = _sidecar_enabled()
+    if use_sidecar:
+        config = _read_sidecar(file_path, st)
+        if config is not None:
+            return config
+    with open(file_path, "rb") as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+    if use_sidecar:
+        try:
+            _write_sidecar(file_path, st, config)
+        except TypeError:  # value JSON can't encode at all
+            pass
+    return config
 
 
 def process_dict(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively process dictionary to replace environment variables."""
+    """Replace environment variables in a loaded config, in place.
+
+    Walks nested dicts and lists iteratively, only writing back the string
+    values that actually reference an environment variable.
+    """
     if not config:
         return {}
-    result = {}
-    for key, value in config.items():
-        if isinstance(value, dict):
-            result[key] = process_dict(value)
-        elif isinstance(value, str):
-            result[key] = replace_env_vars(value)
-        else:
-            result[key] = value
-    return result
-
-
-_config_cache: Dict[str, Dict[str, Any]] = {}
+    environ = os.environ
+    stack: list = [config]
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, str):
+                # $VAR resolves to the env value, falling back to the name itself
+                if value[:1] == "$":
+                    env_var = value[1:]
+                    node[key] = environ.get(env_var, env_var)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return config
+
+
+# file_path -> (st_mtime_ns, st_size, processed_config)
+_config_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+_config_cache_lock = threading.Lock()
 
 
 def load_yaml_config(file_path: str) -> Dict[str, Any]:
     """Load and process YAML configuration file."""
     # 如果文件不存在，返回{}
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         return {}
 
-    # 检查缓存中是否已存在配置
-    if file_path in _config_cache:
-        return _config_cache[file_path]
+    # 检查缓存中是否已存在配置，且文件未被修改
+    cached = _config_cache.get(file_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
 
-    # 如果缓存中不存在，则加载并处理配置
-    with open(file_path, "r") as f:
-        config = yaml.safe_load(f)
+    # 如果缓存中不存在或文件已变更，则加载并处理配置
+    config = _parse_yaml(file_path, st)
     processed_config = process_dict(config)
 
     # 将处理后的配置存入缓存
-    _config_cache[file_path] = processed_config
+    with _config_cache_lock:
+        _config_cache[file_path] = (st.st_mtime_ns, st.st_size, processed_config)
     return processed_config
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configurations so the next load re-reads the files."""
+    with _config_cache_lock:
+        _config_cache.clear()
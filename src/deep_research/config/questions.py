@@ -6,14 +6,14 @@ get started with the Deep Research system. These questions cover various domains
 serve as examples of well-formed research queries.
 
 Constants:
-    BUILT_IN_QUESTIONS: List of English research questions covering various domains
+    BUILT_IN_QUESTIONS: Tuple of English research questions covering various domains
         - Technology: AI, quantum computing, blockchain, cybersecurity
         - Healthcare: AI adoption, medical applications
         - Environment: Climate change, renewable energy, electric vehicles
         - Finance: Machine learning applications in financial services
         - Science: Natural language processing advances
         
-    BUILT_IN_QUESTIONS_ZH_CN: Chinese translations of the research questions
+    BUILT_IN_QUESTIONS_ZH_CN: Tuple of Chinese translations of the research questions
         - Provides localized question templates for Chinese-speaking users
         - Maintains semantic equivalence with English versions
         - Covers the same research domains and topics
@@ -38,7 +38,7 @@ research domains while providing users with concrete examples of effective queri
 """
 
 # English built-in questions
-BUILT_IN_QUESTIONS = [
+BUILT_IN_QUESTIONS: tuple[str, ...] = (
     "What factors are influencing AI adoption in healthcare?",
     "How does quantum computing impact cryptography?",
     "What are the latest developments in renewable energy technology?",
@@ -49,10 +49,10 @@ BUILT_IN_QUESTIONS = [
     "What advances have been made in natural language processing?",
     "How is machine learning transforming the financial industry?",
     "What are the environmental impacts of electric vehicles?",
-]
+)
 
 # Chinese built-in questions
-BUILT_IN_QUESTIONS_ZH_CN = [
+BUILT_IN_QUESTIONS_ZH_CN: tuple[str, ...] = (
     "人工智能在医疗保健领域的应用有哪些因素影响?",
     "量子计算如何影响密码学?",
     "可再生能源技术的最新发展是什么?",
@@ -63,4 +63,4 @@ BUILT_IN_QUESTIONS_ZH_CN = [
     "自然语言处理领域有哪些进展?",
     "机器学习如何改变金融行业?",
     "电动汽车对环境有什么影响?",
-]
+)
@@ -33,6 +33,10 @@ Integration:
 import enum
 
 
-class ReportStyle(enum.Enum):
+class ReportStyle(str, enum.Enum):
     ACADEMIC = "academic"
     POPULAR_SCIENCE = "popular_science"
+
+
+# Plain string default for hot compare paths (e.g. Configuration.report_style)
+DEFAULT_REPORT_STYLE = ReportStyle.ACADEMIC.value
@@ -18,8 +18,10 @@ Key Classes:
         - VIKINGDB_KNOWLEDGE_BASE: Vector database knowledge base
 
 Configuration Variables:
-    SELECTED_SEARCH_ENGINE: Current search engine (from SEARCH_API env var)
-    SELECTED_RAG_PROVIDER: Current RAG provider (from RAG_PROVIDER env var)
+    SELECTED_SEARCH_ENGINE: Current SearchEngine (from SEARCH_API env var, default
+        tavily), or None when SEARCH_API names an unsupported engine
+    SELECTED_RAG_PROVIDER: Current RAGProvider or None (from RAG_PROVIDER env var)
+    SELECTED_SEARCH_ENGINE_VALUE / SELECTED_RAG_PROVIDER_VALUE: Plain string values
 
 Environment Variables:
     - SEARCH_API: Selects the search engine provider (default: "tavily")
@@ -33,14 +35,14 @@ Research workflows can adapt to available services through environment configura
 # 
 
 import enum
+import logging
 import os
 
-from dotenv import load_dotenv
+logger = logging.getLogger(__name__)
 
-load_dotenv()
 
 # Tavily search
-class SearchEngine(enum.Enum):
+class SearchEngine(str, enum.Enum):
     TAVILY = "tavily"
     DUCKDUCKGO = "duckduckgo"
     BRAVE_SEARCH = "brave_search"
@@ -48,14 +50,31 @@ class SearchEngine(enum.Enum):
     WIKIPEDIA = "wikipedia"
 
 
-# Tool configuration
-SELECTED_SEARCH_ENGINE = os.getenv("SEARCH_API", SearchEngine.TAVILY.value)
+# Tool configuration, resolved to the enum once at import time
+_search_api = os.getenv("SEARCH_API", SearchEngine.TAVILY.value).strip().lower()
+SELECTED_SEARCH_ENGINE: SearchEngine | None = None
+try:
+    SELECTED_SEARCH_ENGINE = SearchEngine(_search_api)
+except ValueError:
+    # Never substitute another engine: queries (and API keys) would go to a
+    # provider the operator did not choose. get_web_search_tool() raises.
+    logger.error(f"Unsupported search engine: SEARCH_API={_search_api!r}")
+SELECTED_SEARCH_ENGINE_VALUE: str = _search_api
 
 
 # RAG
-class RAGProvider(enum.Enum):
+class RAGProvider(str, enum.Enum):
     RAGFLOW = "ragflow"
     VIKINGDB_KNOWLEDGE_BASE = "vikingdb_knowledge_base"
 
 
-SELECTED_RAG_PROVIDER = os.getenv("RAG_PROVIDER")
+_rag_provider = (os.getenv("RAG_PROVIDER") or "").strip().lower()
+SELECTED_RAG_PROVIDER: RAGProvider | None = None
+if _rag_provider:
+    try:
+        SELECTED_RAG_PROVIDER = RAGProvider(_rag_provider)
+    except ValueError:
+        logger.warning(f"Unknown RAG_PROVIDER={_rag_provider!r}, RAG is disabled")
+SELECTED_RAG_PROVIDER_VALUE: str | None = (
+    SELECTED_RAG_PROVIDER.value if SELECTED_RAG_PROVIDER else None
+)
@@ -15,9 +15,15 @@ Modules:
         - Crawler: High-level interface for web content extraction
         - crawl(): Complete crawling pipeline from URL to Article
         - Integrates Jina API and readability extraction
+
+    cache.py: URL-keyed Article cache (in-memory LRU + opt-in JSON on disk, TTL)
+
+    async_crawler.py: Concurrent crawling pipeline
+        - crawl_many(): Overlaps many fetches on one pooled async HTTP client
         
     jina_client.py: Jina AI API integration for content fetching
         - JinaClient: HTTP client for Jina Reader API
+        - CrawlTemporarilyUnavailable: Raised for rate-limited/failed fetches
         - crawl(): Fetches web content with configurable output formats
         - Handles authentication and rate limiting
         
@@ -73,9 +79,42 @@ The package enables reliable web content extraction with professional-grade
 content cleaning and formatting suitable for automated research workflows.
 """
 
-from .article import Article
-from .crawler import Crawler
-from .jina_client import JinaClient
-from .readability_extractor import ReadabilityExtractor
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .article import Article
+    from .async_crawler import crawl_many
+    from .crawler import Crawler
+    from .jina_client import CrawlTemporarilyUnavailable, JinaClient
+    from .readability_extractor import ReadabilityExtractor
+
+# Submodules pull in markdownify, readabilipy/lxml and requests, so they are
+# only imported on first attribute access (PEP 562).
+_LAZY_ATTRS = {
+    "Article": "article",
+    "Crawler": "crawler",
+    "CrawlTemporarilyUnavailable": "jina_client",
+    "JinaClient": "jina_client",
+    "ReadabilityExtractor": "readability_extractor",
+    "crawl_many": "async_crawler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["Article", "Crawler", "JinaClient", "ReadabilityExtractor"]
+__all__ = [
+    "Article",
+    "Crawler",
+    "CrawlTemporarilyUnavailable",
+    "JinaClient",
+    "ReadabilityExtractor",
+    "crawl_many",
+]
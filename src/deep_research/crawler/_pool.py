@@ -0,0 +1,38 @@
+"""Shared executors for CPU-heavy crawler post-processing.
+
+HTML to Markdown conversion runs on a thread pool so async callers can keep
+the event loop free while pages are converted. Readability extraction holds
+the GIL for the whole parse, so it gets a process pool instead, created on
+first use so importing the crawler never spawns workers.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+CONVERT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="crawler-convert"
+)
+
+_extract_executor: ProcessPoolExecutor | None = None
+_extract_executor_lock = threading.Lock()
+
+
+def get_extract_executor() -> ProcessPoolExecutor:
+    global _extract_executor
+    if _extract_executor is None:
+        with _extract_executor_lock:
+            if _extract_executor is None:
+                # forkserver children start from a clean interpreter instead of
+                # copying the server process; it is not available on Windows.
+                method = (
+                    "forkserver"
+                    if "forkserver" in multiprocessing.get_all_start_methods()
+                    else None
+                )
+                _extract_executor = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 4,
+                    mp_context=multiprocessing.get_context(method),
+                )
+    return _extract_executor
@@ -12,12 +12,17 @@ Key Classes:
         - url: str - Source URL (set by crawler after extraction)
 
 Key Methods:
-    to_markdown(including_title): Converts article content to markdown format
+    to_markdown(including_title, max_chars): Converts article content to markdown format
         - including_title: bool - Whether to include title as H1 header
+        - max_chars: int | None - Cap on the result; only a prefix of the HTML
+          is converted, growing until it yields enough markdown
         - Returns clean markdown suitable for text processing
         - Uses markdownify library for HTML to markdown conversion
         - Preserves important formatting while removing HTML complexity
         
+    to_markdown_async() / to_message_async(): Same conversions on a shared thread
+        pool so async crawl pipelines don't block the event loop
+
     to_message(): Prepares content for LLM consumption with structured blocks
         - Parses markdown to identify text and image components
         - Returns list of message blocks with type annotations
@@ -62,37 +67,109 @@ the gap between raw HTML extraction and structured content consumption by
 research tools and LLM models.
 """
 
+import asyncio
 import re
+from dataclasses import dataclass, field
 from urllib.parse import urljoin
 
-from markdownify import markdownify as md
+from ._pool import CONVERT_EXECUTOR
 
+_IMAGE_RE = re.compile(r"!\[.*?\]\((.*?)\)")
 
-class Article:
-    url: str
+# Capped conversions render a prefix of the HTML. Cutting the HTML can garble
+# only the element it lands in, so a prefix is accepted once its markdown runs
+# this many characters past the cap.
+_PREFIX_MARGIN = 256
+
+
+def _html_to_markdown(html: str) -> str:
+    # markdownify pulls in BeautifulSoup, so it is imported on first use
+    from markdownify import markdownify
+
+    return markdownify(html)
 
-    def __init__(self, title: str, html_content: str):
-        self.title = title
-        self.html_content = html_content
 
-    def to_markdown(self, including_title: bool = True) -> str:
+@dataclass(slots=True)
+class Article:
+    title: str
+    html_content: str
+    url: str = ""
+    # (html_content, markdown) of the last conversion
+    _md_cache: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_markdown(
+        self, including_title: bool = True, max_chars: int | None = None
+    ) -> str:
         markdown = ""
-        if including_title:
+        if including_title and self.title:
             markdown += f"# {self.title}\n\n"
-        markdown += md(self.html_content)
-        return markdown
+        if max_chars is None:
+            return markdown + self._markdown_body()
+        remaining = max_chars - len(markdown)
+        if remaining <= 0:
+            return markdown[:max_chars]
+        return markdown + self._markdown_prefix(remaining)
+
+    def _markdown_prefix(self, max_chars: int) -> str:
+        # Convert growing prefixes of the HTML until one yields enough markdown,
+        # so a long page costs about max_chars of conversion instead of all of it.
+        html = self.html_content
+        cached = self._md_cache
+        if cached is not None and cached[0] is html:
+            return cached[1][:max_chars]
+        budget = 4 * (max_chars + _PREFIX_MARGIN)
+        while budget < len(html):
+            body = _html_to_markdown(html[:budget])
+            if len(body) >= max_chars + _PREFIX_MARGIN:
+                return body[:max_chars]
+            budget *= 2
+        return self._markdown_body()[:max_chars]
+
+    def _markdown_body(self) -> str:
+        # HTML conversion is the expensive step; reuse it across to_markdown and
+        # to_message calls as long as html_content hasn't been replaced.
+        html = self.html_content
+        cached = self._md_cache
+        if cached is not None and cached[0] is html:
+            return cached[1]
+        body = _html_to_markdown(html)
+        self._md_cache = (html, body)
+        return body
 
     def to_message(self) -> list[dict]:
-        image_pattern = r"!\[.*?\]\((.*?)\)"
-
-        content: list[dict[str, str]] = []
-        parts = re.split(image_pattern, self.to_markdown())
-
-        for i, part in enumerate(parts):
-            if i % 2 == 1:
-                image_url = urljoin(self.url, part.strip())
-                content.append({"type": "image_url", "image_url": {"url": image_url}})
-            else:
-                content.append({"type": "text", "text": part.strip()})
+        md_text = self.to_markdown()
+
+        # Single regex pass: slice the text between image matches directly
+        # instead of splitting into an intermediate list. Empty text segments
+        # (e.g. between adjacent images) are dropped.
+        content: list[dict] = []
+        base_url = self.url
+        pos = 0
+        for match in _IMAGE_RE.finditer(md_text):
+            text = md_text[pos : match.start()].strip()
+            if text:
+                content.append({"type": "text", "text": text})
+            image_url = urljoin(base_url, match.group(1).strip())
+            content.append({"type": "image_url", "image_url": {"url": image_url}})
+            pos = match.end()
+        text = md_text[pos:].strip()
+        if text:
+            content.append({"type": "text", "text": text})
 
         return content
+
+    async def to_markdown_async(
+        self, including_title: bool = True, max_chars: int | None = None
+    ) -> str:
+        """Run to_markdown on the shared conversion pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            CONVERT_EXECUTOR, self.to_markdown, including_title, max_chars
+        )
+
+    async def to_message_async(self) -> list[dict]:
+        """Run to_message on the shared conversion pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(CONVERT_EXECUTOR, self.to_message)
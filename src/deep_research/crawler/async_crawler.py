@@ -0,0 +1,110 @@
+"""
+Concurrent Crawling Pipeline
+
+This module overlaps many Jina fetches on a single pooled httpx.AsyncClient
+and runs readability extraction in a process pool, so crawling N URLs costs
+roughly the slowest fetch instead of the sum of all of them.
+
+Key Functions:
+    acrawl(url): Crawls one URL on the shared per-event-loop client
+        from tools._http
+        - Concurrent acrawl calls (e.g. parallel tool calls) overlap their fetches
+
+    crawl_many(urls, concurrency): Crawls URLs concurrently
+        - Returns results in input order
+        - Failed URLs yield the raised exception instead of an Article
+"""
+
+import asyncio
+import logging
+import weakref
+
+import httpx
+
+from src.deep_research.tools._http import async_client
+
+from .article import Article
+from .cache import NEGATIVE_CACHE_TTL, article_cache
+from .jina_client import CrawlTemporarilyUnavailable, JinaClient
+from .readability_extractor import ReadabilityExtractor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 32
+
+_JINA_CLIENT = JinaClient()
+_EXTRACTOR = ReadabilityExtractor()
+
+
+async def _crawl_one(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    jina_client: JinaClient,
+    extractor: ReadabilityExtractor,
+    url: str,
+) -> Article:
+    cached = await article_cache.aget(url)
+    if cached is not None:
+        return cached
+    remaining = article_cache.negative_remaining(url)
+    if remaining:
+        raise CrawlTemporarilyUnavailable(url, remaining)
+    try:
+        async with semaphore:
+            html = await jina_client.acrawl(client, url, return_format="html")
+    except CrawlTemporarilyUnavailable as e:
+        article_cache.set_negative(url, e.retry_after or NEGATIVE_CACHE_TTL)
+        raise
+    except httpx.HTTPError:
+        article_cache.set_negative(url, NEGATIVE_CACHE_TTL)
+        raise
+    article = await extractor.extract_article_async(html)
+    article.url = url
+    if article.html_content:
+        await article_cache.aset(url, article)
+    return article
+
+
+# Single-URL crawls share the tools' pooled client for the running event loop
+# (closed by the server lifespan) and one concurrency limit per loop.
+_loop_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _loop_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _loop_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _loop_semaphores[loop] = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+    return semaphore
+
+
+async def acrawl(url: str) -> Article:
+    """Crawl one url on the loop's shared client; concurrent calls overlap."""
+    return await _crawl_one(
+        async_client(), _loop_semaphore(), _JINA_CLIENT, _EXTRACTOR, url
+    )
+
+
+async def crawl_many(
+    urls: list[str], concurrency: int = DEFAULT_CONCURRENCY
+) -> list[Article | BaseException]:
+    """Crawl urls concurrently, returning Articles (or exceptions) in input order."""
+    semaphore = asyncio.Semaphore(concurrency)
+    jina_client = JinaClient()
+    extractor = ReadabilityExtractor()
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    timeout = httpx.Timeout(30.0, connect=5.0)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        results = await asyncio.gather(
+            *(
+                _crawl_one(client, semaphore, jina_client, extractor, url)
+                for url in urls
+            ),
+            return_exceptions=True,
+        )
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Failed to crawl {url}: {result!r}")
+    return results
@@ -0,0 +1,185 @@
+"""
+Two-tier Article Cache for the Crawler
+
+Research workflows often revisit the same URLs across plan iterations. This
+module keeps recently crawled Articles in an in-process LRU and, when a cache
+directory is configured, persists them as JSON files so other processes (and
+restarts) can reuse them too.
+
+Key Classes:
+    ArticleCache: URL-keyed cache with a TTL
+        - get(url) / aget(url): Returns a cached Article or None; aget reads
+          the disk tier in a worker thread
+        - set(url, article) / aset(url, article): Stores an Article in both
+          tiers; aset writes the disk tier in a worker thread
+        - set_negative(url, ttl) / negative_remaining(url): In-memory record of
+          failed fetches so a rate-limited URL is not hammered again right away
+
+Entries are keyed by a 128-bit BLAKE2b digest of CACHE_VERSION and the URL. Disk entries hold only the Article's title, html_content
+and url, so reading one never executes code.
+
+Configuration:
+    - CRAWLER_CACHE_DIR: Directory for on-disk entries (unset or empty keeps
+      the cache in memory only)
+    - CRAWLER_CACHE_TTL: Entry lifetime in seconds (default: 86400)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from .article import Article
+
+logger = logging.getLogger(__name__)
+
+# How long a failed fetch blocks re-fetching when the server gives no Retry-After
+NEGATIVE_CACHE_TTL = 60.0
+
+# Part of every cache key; bump when extraction output changes so stale disk
+# entries from an older crawler are ignored instead of served for a full TTL
+CACHE_VERSION = 1
+
+
+class ArticleCache:
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: float = 86400,
+        max_memory_entries: int = 1024,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, tuple[float, Article]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dir: Optional[Path] = Path(cache_dir).expanduser() if cache_dir else None
+        # url key -> monotonic deadline before which the URL is not re-fetched
+        self._negative: dict[str, float] = {}
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.blake2b(
+            f"{CACHE_VERSION}:{url}".encode(), digest_size=16
+        ).hexdigest()
+
+    def get(self, url: str) -> Optional[Article]:
+        key = self._key(url)
+        now = time.time()
+        article = self._recall(key, now)
+        if article is None and self._dir is not None:
+            article = self._load(key, now)
+        return article
+
+    async def aget(self, url: str) -> Optional[Article]:
+        key = self._key(url)
+        now = time.time()
+        article = self._recall(key, now)
+        if article is None and self._dir is not None:
+            article = await asyncio.to_thread(self._load, key, now)
+        return article
+
+    def set(self, url: str, article: Article) -> None:
+        key = self._key(url)
+        self._remember(key, time.time(), article)
+        if self._dir is not None:
+            self._store(key, article)
+
+    async def aset(self, url: str, article: Article) -> None:
+        key = self._key(url)
+        self._remember(key, time.time(), article)
+        if self._dir is not None:
+            await asyncio.to_thread(self._store, key, article)
+
+    def negative_remaining(self, url: str) -> float:
+        """Seconds left on a recorded failure for url, or 0 if it may be fetched."""
+        key = self._key(url)
+        now = time.monotonic()
+        with self._lock:
+            deadline = self._negative.get(key)
+            if deadline is None:
+                return 0.0
+            if deadline <= now:
+                del self._negative[key]
+                return 0.0
+            return deadline - now
+
+    def set_negative(self, url: str, ttl_seconds: float) -> None:
+        key = self._key(url)
+        now = time.monotonic()
+        with self._lock:
+            self._negative[key] = now + ttl_seconds
+            if len(self._negative) > self.max_memory_entries:
+                self._negative = {
+                    k: v for k, v in self._negative.items() if v > now
+                }
+
+    def _recall(self, key: str, now: float) -> Optional[Article]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if now - entry[0] < self.ttl_seconds:
+                self._memory.move_to_end(key)
+                return entry[1]
+            del self._memory[key]
+            return None
+
+    def _load(self, key: str, now: float) -> Optional[Article]:
+        path = self._dir / f"{key}.json"
+        try:
+            stored_at = path.stat().st_mtime
+            if now - stored_at >= self.ttl_seconds:
+                return None
+            with open(path, "rb") as f:
+                data = json.load(f)
+            article = Article(
+                title=data["title"], html_content=data["html_content"], url=data["url"]
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable crawler cache entry {path}: {e}")
+            return None
+        self._remember(key, stored_at, article)
+        return article
+
+    def _store(self, key: str, article: Article) -> None:
+        path = self._dir / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        data = {
+            "title": article.title,
+            "html_content": article.html_content,
+            "url": article.url,
+        }
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write crawler cache entry {path}: {e}")
+
+    def _remember(self, key: str, stored_at: float, article: Article) -> None:
+        with self._lock:
+            self._memory[key] = (stored_at, article)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+
+def _default_cache() -> ArticleCache:
+    cache_dir = os.getenv("CRAWLER_CACHE_DIR", "")
+    try:
+        ttl = float(os.getenv("CRAWLER_CACHE_TTL", "86400"))
+    except ValueError:
+        ttl = 86400
+    return ArticleCache(cache_dir=cache_dir or None, ttl_seconds=ttl)
+
+
+article_cache = _default_cache()
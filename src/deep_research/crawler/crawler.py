@@ -17,6 +17,15 @@ Key Methods:
         - Returns: Article - Structured article object with clean content
         - Coordinates multiple extraction technologies for optimal results
         - Handles the complete pipeline: fetch → clean → structure → return
+        - Raises CrawlTemporarilyUnavailable for URLs that recently failed,
+          without hitting Jina again until the failure expires
+
+    acrawl(url): Async variant of crawl
+        - Fetches on a per-event-loop pooled httpx.AsyncClient (async_crawler.py)
+
+    crawl_many(urls, concurrency): Concurrent variant of crawl for many URLs
+        - Overlaps Jina fetches on a pooled httpx.AsyncClient (async_crawler.py)
+        - Returns Articles (or the raised exceptions) in input order
 
 Crawling Pipeline:
     1. Content Fetching: Uses JinaClient to retrieve raw HTML content
@@ -62,7 +71,8 @@ Use Cases:
 
 Performance Considerations:
     - Efficient Processing: Optimized pipeline for speed and resource usage
-    - Caching Support: Content can be cached to avoid repeated fetching
+    - Caching Support: Articles are cached per URL in memory, and optionally
+      on disk (cache.py)
     - Scalability: Designed for high-volume content processing
     - Rate Limiting: Respects API limits and web server constraints
 
@@ -72,11 +82,18 @@ for automated research and analysis workflows.
 """
 
 from .article import Article
-from .jina_client import JinaClient
+from .cache import NEGATIVE_CACHE_TTL, article_cache
+from .jina_client import CrawlTemporarilyUnavailable, JinaClient
 from .readability_extractor import ReadabilityExtractor
 
 
 class Crawler:
+    def __init__(self):
+        # Both are stateless (the HTTP session is module-level in jina_client),
+        # so one pair serves every crawl made through this Crawler.
+        self._jina_client = JinaClient()
+        self._extractor = ReadabilityExtractor()
+
     def crawl(self, url: str) -> Article:
         # To help LLMs better understand content, we extract clean
         # articles from HTML, convert them to markdown, and split
@@ -88,9 +105,41 @@ class Crawler:
         #
         # Instead of using Jina's own markdown converter, we'll use
         # our own solution to get better readability results.
-        jina_client = JinaClient()
-        html = jina_client.crawl(url, return_format="html")
-        extractor = ReadabilityExtractor()
-        article = extractor.extract_article(html)
+        cached = article_cache.get(url)
+        if cached is not None:
+            return cached
+
+        remaining = article_cache.negative_remaining(url)
+        if remaining:
+            raise CrawlTemporarilyUnavailable(url, remaining)
+
+        import requests
+
+        try:
+            html = self._jina_client.crawl(url, return_format="html")
+        except CrawlTemporarilyUnavailable as e:
+            article_cache.set_negative(url, e.retry_after or NEGATIVE_CACHE_TTL)
+            raise
+        except requests.RequestException:
+            article_cache.set_negative(url, NEGATIVE_CACHE_TTL)
+            raise
+        article = self._extractor.extract_article(html)
         article.url = url
+        if article.html_content:
+            article_cache.set(url, article)
         return article
+
+    async def acrawl(self, url: str) -> Article:
+        # Async crawl on a pooled client shared by the running event loop
+        from .async_crawler import acrawl
+
+        return await acrawl(url)
+
+    async def crawl_many(
+        self, urls: list[str], concurrency: int = 32
+    ) -> list[Article | BaseException]:
+        # Overlap fetches instead of paying N sequential round trips; see
+        # async_crawler for the pooled client and off-loop extraction.
+        from .async_crawler import crawl_many
+
+        return await crawl_many(urls, concurrency=concurrency)
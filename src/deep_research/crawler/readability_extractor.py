@@ -7,7 +7,7 @@ article content while removing noise and non-essential elements.
 
 Key Classes:
     ReadabilityExtractor: Content cleaning and extraction engine
-        - Uses readabilipy library for advanced content extraction
+        - Uses readability-lxml (or readabilipy when forced) for content extraction
         - Applies readability algorithms to identify main article content
         - Removes advertisements, navigation, and boilerplate content
 
@@ -17,6 +17,13 @@ Key Methods:
         - Returns: Article - Structured article object with cleaned content
         - Applies sophisticated algorithms to identify and extract main content
         - Preserves important formatting while removing noise
+        - Pages with too little markup or too few paragraphs to hold an article
+          skip scoring and return their plain text (or the readabilipy result
+          when USE_READABILIPY=true)
+
+    extract_article_async(html): Awaitable extract_article
+        - Runs in a process pool so parsing neither holds the event loop nor
+          contends for the GIL with other extractions
 
 Readability Algorithm Features:
     Content Identification:
@@ -46,7 +53,10 @@ Processing Pipeline:
     6. Article Creation: Constructs Article object with clean content
 
 Library Integration:
-    - Readabilipy: Python implementation of readability algorithms
+    - readability-lxml: libxml2-backed extraction, used by default
+    - lxml Cleaner: Strips script/style/noscript/embedded subtrees before
+      either extractor walks the DOM
+    - Readabilipy: Used instead when USE_READABILIPY=true
     - Simple JSON Interface: Uses simple_json_from_html_string function
     - Readability Mode: Enables advanced content extraction algorithms
     - Structured Output: Returns standardized content and metadata
@@ -88,15 +98,156 @@ raw web content into clean, readable articles suitable for research analysis
 and automated processing workflows.
 """
 
-from readabilipy import simple_json_from_html_string
+import asyncio
+import functools
+import os
+import re
+from html import escape
+from itertools import islice
+from typing import TYPE_CHECKING
 
+from ._pool import get_extract_executor
 from .article import Article
 
+if TYPE_CHECKING:
+    import lxml.html
+
+
+# lxml, readability-lxml and the cleaner are imported on first extraction so
+# that importing the crawler (e.g. via the tools package) stays cheap.
+@functools.cache
+def _readability_document():
+    from readability import Document
+
+    return Document
+
+
+@functools.cache
+def _cleaner():
+    # lxml >= 5.2 ships the cleaner as the separate lxml_html_clean package
+    from lxml_html_clean import Cleaner
+
+    # Drop subtrees readability would discard anyway before it walks the DOM.
+    # Everything that feeds scoring (class/id attributes, links, images, forms,
+    # page structure) is left alone.
+    return Cleaner(
+        scripts=True,
+        javascript=True,
+        style=True,
+        comments=True,
+        embedded=True,
+        kill_tags=["noscript"],
+        links=False,
+        meta=False,
+        page_structure=False,
+        processing_instructions=True,
+        frames=False,
+        forms=False,
+        annoying_tags=False,
+        remove_unknown_tags=False,
+        safe_attrs_only=False,
+    )
+
+
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+# Containers that carry nothing once they have no children and no text
+_EMPTY_REMOVABLE = frozenset(
+    {"div", "span", "p", "section", "article", "li", "ul", "ol"}
+    | {"font", "b", "i", "em", "strong"}
+)
+
+
+def _remove_empty_tags(tree: "lxml.html.HtmlElement") -> None:
+    # Reverse document order visits children before their parents, so a
+    # container emptied by this pass is removed in the same pass.
+    for el in reversed(list(tree.iter(*_EMPTY_REMOVABLE))):
+        if len(el) or (el.text or "").strip() or el.getparent() is None:
+            continue
+        # drop_tree keeps el.tail attached to the surrounding content
+        el.drop_tree()
+
+
+# Pages with fewer paragraphs or less markup than this (login walls, JS shells,
+# error pages) have no article to score, so extraction is skipped for them.
+_MIN_PARAGRAPHS = 5
+_MIN_HTML_LENGTH = 1400
+_PARAGRAPH_RE = re.compile(r"<p[\s>]", re.IGNORECASE)
+
+
+def _probably_readable(html: str) -> bool:
+    if len(html) <= _MIN_HTML_LENGTH:
+        return False
+    # Stop scanning as soon as enough paragraphs have been seen
+    found = sum(1 for _ in islice(_PARAGRAPH_RE.finditer(html), _MIN_PARAGRAPHS))
+    return found >= _MIN_PARAGRAPHS
+
+
+def _use_readabilipy() -> bool:
+    return os.getenv("USE_READABILIPY", "false").lower() in _TRUTHY
+
 
 class ReadabilityExtractor:
     def extract_article(self, html: str) -> Article:
+        if _use_readabilipy():
+            return self._extract_with_readabilipy(html)
+
+        if not _probably_readable(html):
+            return self._extract_text(html)
+
+        # readability-lxml parses with libxml2 instead of spawning Node.js or
+        # walking a BeautifulSoup tree. Hand it a pre-parsed tree so its
+        # retry passes re-clean a copy of the tree instead of re-parsing the
+        # HTML string, and reuse the same tree for the title fallback.
+        tree = self._parse_once(html)
+        doc = _readability_document()(tree)
+        title = doc.short_title() or tree.findtext(".//title")
+        return Article(
+            title=title,
+            html_content=doc.summary(html_partial=True),
+        )
+
+    async def extract_article_async(self, html: str) -> Article:
+        """Run extract_article in the extraction process pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_extract_executor(), _extract, html)
+
+    @staticmethod
+    def _parse_once(html: str) -> "lxml.html.HtmlElement":
+        import lxml.html
+
+        tree = lxml.html.document_fromstring(html)
+        # Clean in place; clean_html() would deep-copy the tree first
+        _cleaner()(tree)
+        _remove_empty_tags(tree)
+        return tree
+
+    def _extract_text(self, html: str) -> Article:
+        # No article to score: keep the page's visible text and title as-is
+        if not html.strip():
+            return Article(title="", html_content="")
+        tree = self._parse_once(html)
+        title = (tree.findtext(".//title") or "").strip()
+        body = tree.find("body")
+        text = " ".join((tree if body is None else body).text_content().split())
+        return Article(
+            title=title, html_content=f"<p>{escape(text)}</p>" if text else ""
+        )
+
+    def _extract_with_readabilipy(self, html: str) -> Article:
+        from readabilipy import simple_json_from_html_string
+
+        try:
+            html = _cleaner().clean_html(html)
+        except ValueError:  # undecodable or otherwise unparsable input
+            pass
         article = simple_json_from_html_string(html, use_readability=True)
         return Article(
-            title=article.get("title"),
-            html_content=article.get("content"),
+            title=article.get("title") or "",
+            html_content=article.get("content") or "",
         )
+
+
+def _extract(html: str) -> Article:
+    # Top-level so the process pool can pickle it by reference
+    return ReadabilityExtractor().extract_article(html)
@@ -16,20 +16,28 @@ Functions:
 
 Supports conversation persistence across different storage backends with automatic
 failover to in-memory storage when external databases are unavailable. Includes
-message streaming capabilities for real-time UI updates.
+message streaming capabilities for real-time UI updates. When a conversation
+finishes during an SSE stream, its database write runs on a background writer
+thread instead of blocking the event loop.
 """
 
+import asyncio
 import json
 import logging
+import sys
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 import psycopg
 from psycopg.rows import dict_row
 from pymongo import MongoClient
 from langgraph.store.memory import InMemoryStore
 from src.deep_research.config.configuration import get_bool_env, get_str_env
 
+# finish_reason values that end a streamed conversation
+_FINAL_FINISH_REASONS = frozenset({"stop", "interrupt"})
+
 
 class ChatStreamManager:
     """
@@ -44,6 +52,8 @@ class ChatStreamManager:
         mongo_client (MongoClient): MongoDB client connection
         mongo_db (Database): MongoDB database instance
         postgres_conn (psycopg.Connection): PostgreSQL connection
+        _persist_executor (ThreadPoolExecutor): Single writer thread for
+            conversation writes issued from the event loop
         logger (logging.Logger): Logger instance for this class
     """
 
@@ -67,6 +77,14 @@ class ChatStreamManager:
         self.mongo_client = None
         self.mongo_db = None
         self.postgres_conn = None
+        # thread_id -> index of the last chunk stored for it, kept only while
+        # the thread's stream is open
+        self._cursors: dict[str, int] = {}
+        # One thread, so writes keep their order and the single psycopg
+        # connection is never used concurrently
+        self._persist_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="chat-stream-persist"
+        )
 
         if self.checkpoint_saver:
             if self.db_uri.startswith("mongodb://"):
@@ -130,7 +148,7 @@ class ChatStreamManager:
 
     def process_stream_message(
         self, thread_id: str, message: str, finish_reason: str
-    ) -> bool:
+    ) -> Union[bool, "Future[bool]"]:
         """
         Process and store a chat stream message chunk.
 
@@ -144,7 +162,9 @@ class ChatStreamManager:
             finish_reason: Reason for message completion ("stop", "interrupt", or partial)
 
         Returns:
-            bool: True if message was processed successfully, False otherwise
+            bool: True if message was processed successfully, False otherwise.
+            When a finished conversation is written from a running event loop,
+            the Future of the queued write is returned instead.
         """
         if not thread_id or not isinstance(thread_id, str):
             self.logger.warning("Invalid thread_id provided")
@@ -158,23 +178,23 @@ class ChatStreamManager:
             # Create namespace for this thread's messages
             store_namespace: Tuple[str, str] = ("messages", thread_id)
 
-            # Get or initialize message cursor for tracking chunks
-            cursor = self.store.get(store_namespace, "cursor")
-            current_index = 0
-
-            if cursor is None:
-                # Initialize cursor for new conversation
-                self.store.put(store_namespace, "cursor", {"index": 0})
-            else:
-                # Increment index for next chunk
-                current_index = int(cursor.value.get("index", 0)) + 1
-                self.store.put(store_namespace, "cursor", {"index": current_index})
+            # Advance the thread's chunk cursor (starts at 0). It is a plain
+            # counter rather than a store item, so each chunk costs one put.
+            last_index = self._cursors.get(thread_id)
+            if last_index is None:
+                # First chunk of a stream; a resumed thread (e.g. after an
+                # interrupt) continues after the chunks it already stored
+                stored = self.store.search(store_namespace, limit=sys.maxsize)
+                last_index = len(stored) - 1
+            current_index = last_index + 1
+            self._cursors[thread_id] = current_index
 
             # Store the current message chunk
             self.store.put(store_namespace, f"chunk_{current_index}", message)
 
             # Check if conversation is complete and should be persisted
-            if finish_reason in ("stop", "interrupt"):
+            if finish_reason in _FINAL_FINISH_REASONS:
+                del self._cursors[thread_id]
                 return self._persist_complete_conversation(
                     thread_id, store_namespace, current_index
                 )
@@ -189,7 +209,7 @@ class ChatStreamManager:
 
     def _persist_complete_conversation(
         self, thread_id: str, store_namespace: Tuple[str, str], final_index: int
-    ) -> bool:
+    ) -> Union[bool, "Future[bool]"]:
         """
         Persist completed conversation to database (MongoDB or PostgreSQL).
 
@@ -202,18 +222,19 @@ class ChatStreamManager:
             final_index: The final chunk index for this conversation
 
         Returns:
-            bool: True if persistence was successful, False otherwise
+            bool: True if persistence was successful, False otherwise. Inside a
+            running event loop the write is queued on the writer thread and its
+            Future is returned; it resolves to the same bool.
         """
         try:
             # Retrieve all message chunks from memory store
-            # Get all messages up to the final index including cursor metadata
-            memories = self.store.search(store_namespace, limit=final_index + 2)
+            # Get all message chunks up to the final index
+            memories = self.store.search(store_namespace, limit=final_index + 1)
 
-            # Extract message content, filtering out cursor metadata
+            # Extract message content
             messages: List[str] = []
             for item in memories:
                 value = item.dict().get("value", "")
-                # Skip cursor metadata, only include actual message chunks
                 if value and not isinstance(value, dict):
                     messages.append(str(value))
 
@@ -227,13 +248,22 @@ class ChatStreamManager:
 
             # Choose persistence method based on available connection
             if self.mongo_db is not None:
-                return self._persist_to_mongodb(thread_id, messages)
+                persist = self._persist_to_mongodb
             elif self.postgres_conn is not None:
-                return self._persist_to_postgresql(thread_id, messages)
+                persist = self._persist_to_postgresql
             else:
                 self.logger.warning("No database connection available")
                 return False
 
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return persist(thread_id, messages)
+            # Called from the SSE stream: the blocking database write runs on
+            # the writer thread so the final events are not held back by it.
+            # Its outcome is only known later, so the Future is returned.
+            return self._persist_executor.submit(persist, thread_id, messages)
+
         except Exception as e:
             self.logger.error(
                 f"Error persisting conversation for thread {thread_id}: {e}"
@@ -246,35 +276,23 @@ class ChatStreamManager:
             # Get MongoDB collection for chat streams
             collection = self.mongo_db.chat_streams
 
-            # Check if conversation already exists in database
-            existing_document = collection.find_one({"thread_id": thread_id})
-
-            current_timestamp = datetime.now()
-
-            if existing_document:
-                # Update existing conversation with new messages
-                update_result = collection.update_one(
-                    {"thread_id": thread_id},
-                    {"$set": {"messages": messages, "ts": current_timestamp}},
-                )
-                self.logger.info(
-                    f"Updated conversation for thread {thread_id}: "
-                    f"{update_result.modified_count} documents modified"
-                )
-                return update_result.modified_count > 0
-            else:
-                # Create new conversation document
-                new_document = {
-                    "thread_id": thread_id,
-                    "messages": messages,
-                    "ts": current_timestamp,
-                    "id": uuid.uuid4().hex,
-                }
-                insert_result = collection.insert_one(new_document)
-                self.logger.info(
-                    f"Created new conversation: {insert_result.inserted_id}"
-                )
-                return insert_result.inserted_id is not None
+            # Upsert in one round trip; the document id is only set on insert
+            result = collection.update_one(
+                {"thread_id": thread_id},
+                {
+                    "$set": {"messages": messages, "ts": datetime.now()},
+                    "$setOnInsert": {"id": uuid.uuid4().hex},
+                },
+                upsert=True,
+            )
+            if result.upserted_id is not None:
+                self.logger.info(f"Created new conversation: {result.upserted_id}")
+                return True
+            self.logger.info(
+                f"Updated conversation for thread {thread_id}: "
+                f"{result.modified_count} documents modified"
+            )
+            return result.modified_count > 0
 
         except Exception as e:
             self.logger.error(f"Error persisting to MongoDB: {e}")
@@ -284,50 +302,25 @@ class ChatStreamManager:
         """Persist conversation to PostgreSQL."""
         try:
             with self.postgres_conn.cursor() as cursor:
-                # Check if conversation already exists
+                # thread_id is UNIQUE, so insert-or-update is a single statement
+                # instead of a SELECT followed by an UPDATE or INSERT
                 cursor.execute(
-                    "SELECT id FROM chat_streams WHERE thread_id = %s", (thread_id,)
+                    """
+                    INSERT INTO chat_streams (id, thread_id, messages, ts)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (thread_id)
+                    DO UPDATE SET messages = EXCLUDED.messages, ts = EXCLUDED.ts
+                    """,
+                    (uuid.uuid4(), thread_id, json.dumps(messages), datetime.now()),
                 )
-                existing_record = cursor.fetchone()
-
-                current_timestamp = datetime.now()
-                messages_json = json.dumps(messages)
-
-                if existing_record:
-                    # Update existing conversation with new messages
-                    cursor.execute(
-                        """
-                        UPDATE chat_streams 
-                        SET messages = %s, ts = %s 
-                        WHERE thread_id = %s
-                        """,
-                        (messages_json, current_timestamp, thread_id),
-                    )
-                    affected_rows = cursor.rowcount
-                    self.postgres_conn.commit()
-
-                    self.logger.info(
-                        f"Updated conversation for thread {thread_id}: "
-                        f"{affected_rows} rows modified"
-                    )
-                    return affected_rows > 0
-                else:
-                    # Create new conversation record
-                    conversation_id = uuid.uuid4()
-                    cursor.execute(
-                        """
-                        INSERT INTO chat_streams (id, thread_id, messages, ts) 
-                        VALUES (%s, %s, %s, %s)
-                        """,
-                        (conversation_id, thread_id, messages_json, current_timestamp),
-                    )
-                    affected_rows = cursor.rowcount
-                    self.postgres_conn.commit()
-
-                    self.logger.info(
-                        f"Created new conversation with ID: {conversation_id}"
-                    )
-                    return affected_rows > 0
+                affected_rows = cursor.rowcount
+                self.postgres_conn.commit()
+
+                self.logger.info(
+                    f"Persisted conversation for thread {thread_id}: "
+                    f"{affected_rows} rows written"
+                )
+                return affected_rows > 0
 
         except Exception as e:
             self.logger.error(f"Error persisting to PostgreSQL: {e}")
@@ -337,6 +330,9 @@ class ChatStreamManager:
 
     def close(self) -> None:
         """Close database connections."""
+        # Let queued conversation writes finish before the connections go away
+        self._persist_executor.shutdown(wait=True)
+
         try:
             if self.mongo_client is not None:
                 self.mongo_client.close()
@@ -368,20 +364,26 @@ _default_manager = ChatStreamManager(
 )
 
 
-def chat_stream_message(thread_id: str, message: str, finish_reason: str) -> bool:
+def chat_stream_message(
+    thread_id: str, message: str | bytes, finish_reason: str
+) -> Union[bool, "Future[bool]"]:
     """
     Legacy function wrapper for backward compatibility.
 
     Args:
         thread_id: Unique identifier for the conversation thread
-        message: The message content to store
+        message: The message content to store (UTF-8 bytes are decoded only
+            when the checkpoint saver is enabled)
         finish_reason: Reason for message completion
 
     Returns:
-        bool: True if message was processed successfully
+        bool: True if message was processed successfully, or the Future of a
+        conversation write queued from a running event loop
     """
-    checkpoint_saver = get_bool_env("LANGGRAPH_CHECKPOINT_SAVER", False)
-    if checkpoint_saver:
+    # Same setting the default manager was built with at import
+    if _default_manager.checkpoint_saver:
+        if isinstance(message, bytes):
+            message = message.decode()
         return _default_manager.process_stream_message(
             thread_id, message, finish_reason
         )
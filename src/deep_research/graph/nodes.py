@@ -33,7 +33,12 @@ from langgraph.types import Command, interrupt
 import openai
 
 from src.deep_research.config.configuration import Configuration
-from src.deep_research.config.agents import AGENT_LLM_MAP
+from src.deep_research.config.agents import (
+    AGENT_LLM_MAP,
+    COORDINATOR,
+    PLANNER,
+    REPORTER,
+)
 from src.deep_research.llms.llm import get_llm_by_type
 from src.deep_research.agents import create_agent
 from src.deep_research.prompts.planner_model import Plan
@@ -44,7 +49,7 @@ from src.deep_research.tools import (
     get_web_search_tool,
     python_repl_tool,
 )
-from src.deep_research.tools.search import LoggedTavilySearch
+from src.deep_research.tools import search as search_tools
 from src.deep_research.utils.json_utils import repair_json_output
 
 from ..config import SELECTED_SEARCH_ENGINE, SearchEngine
@@ -52,6 +57,11 @@ from .types import State
 
 logger = logging.getLogger(__name__)
 
+# Keys of an MCP server config that are passed through to MultiServerMCPClient
+_MCP_CONNECTION_KEYS = frozenset(
+    {"transport", "command", "args", "url", "env", "headers"}
+)
+
 
 @tool
 def handoff_to_planner(
@@ -69,8 +79,8 @@ def background_investigation_node(state: State, config: RunnableConfig):
     configurable = Configuration.from_runnable_config(config)
     query = state.get("research_topic")
     background_investigation_results = None
-    if SELECTED_SEARCH_ENGINE == SearchEngine.TAVILY.value:
-        searched_content = LoggedTavilySearch(
+    if SELECTED_SEARCH_ENGINE is SearchEngine.TAVILY:
+        searched_content = search_tools.LoggedTavilySearch(
             max_results=configurable.max_search_results
         ).invoke(query)
         if isinstance(searched_content, list):
@@ -122,20 +132,20 @@ def planner_node(
 
     if configurable.enable_deep_thinking:
         llm = get_llm_by_type("reasoning")
-    elif AGENT_LLM_MAP["planner"] == "basic":
+    elif AGENT_LLM_MAP[PLANNER] == "basic":
         llm = get_llm_by_type("basic").with_structured_output(
             Plan,
             # method="json_mode",
         )
     else:
-        llm = get_llm_by_type(AGENT_LLM_MAP["planner"])
+        llm = get_llm_by_type(AGENT_LLM_MAP[PLANNER])
 
     # if the plan iterations is greater than the max plan iterations, return the reporter node
     if plan_iterations >= configurable.max_plan_iterations:
         return Command(goto="reporter")
 
     full_response = ""
-    if AGENT_LLM_MAP["planner"] == "basic" and not configurable.enable_deep_thinking:
+    if AGENT_LLM_MAP[PLANNER] == "basic" and not configurable.enable_deep_thinking:
         try:
             response = llm.invoke(messages)
             full_response = response.model_dump_json(indent=4, exclude_none=True)
@@ -254,7 +264,7 @@ def coordinator_node(
     configurable = Configuration.from_runnable_config(config)
     messages = apply_prompt_template("coordinator", state)
     response = (
-        get_llm_by_type(AGENT_LLM_MAP["coordinator"])
+        get_llm_by_type(AGENT_LLM_MAP[COORDINATOR])
         .bind_tools([handoff_to_planner])
         .invoke(messages)
     )
@@ -332,7 +342,7 @@ def reporter_node(state: State, config: RunnableConfig):
             )
         )
     logger.debug(f"Current invoke messages: {invoke_messages}")
-    response = get_llm_by_type(AGENT_LLM_MAP["reporter"]).invoke(invoke_messages)
+    response = get_llm_by_type(AGENT_LLM_MAP[REPORTER]).invoke(invoke_messages)
     response_content = response.content
     logger.info(f"reporter response: {response_content}")
 
@@ -494,7 +504,7 @@ async def _setup_and_execute_agent_step(
                 mcp_servers[server_name] = {
                     k: v
                     for k, v in server_config.items()
-                    if k in ("transport", "command", "args", "url", "env", "headers")
+                    if k in _MCP_CONNECTION_KEYS
                 }
                 for tool_name in server_config["enabled_tools"]:
                     enabled_tools[tool_name] = server_name
@@ -24,8 +24,8 @@ class State(MessagesState):
     # Runtime Variables
     locale: str = "en-US"
     research_topic: str = ""
-    observations: list[str] = []
-    resources: list[Resource] = []
+    observations: list[str]
+    resources: list[Resource]
     plan_iterations: int = 0
     current_plan: Plan | str = None
     final_report: str = ""
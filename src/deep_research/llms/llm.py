@@ -11,6 +11,8 @@ Key Functions:
     _create_llm_use_conf(llm_type, conf): Creates LLM instances using merged configurations
     get_llm_by_type(llm_type): Main factory function to get cached LLM instances by type
     get_configured_llm_models(): Returns all configured models grouped by type
+        (rebuilt only when conf.yaml is reloaded; {LLM_TYPE}_MODEL__* environment
+        changes are picked up with it)
 
 Supported LLM Types:
     - reasoning: For complex reasoning tasks (e.g., DeepSeek, thinking models)
@@ -33,6 +35,7 @@ Caching:
     - LLM instances are cached globally to avoid repeated initialization
     - Cache key is the LLM type (reasoning, basic, vision, code)
     - Improves performance and reduces API connection overhead
+    - Models with verify_ssl disabled share one pair of httpx clients
 
 Error Handling:
     - Graceful fallback for missing configurations
@@ -41,7 +44,9 @@ Error Handling:
     - Comprehensive error messages for debugging
 """
 
+import functools
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, get_args
 
@@ -56,6 +61,16 @@ from src.deep_research.llms.providers.dashscope import ChatDashscope
 
 # Cache for LLM instances
 _llm_cache: dict[LLMType, BaseChatModel] = {}
+# Serializes first construction so concurrent callers share one client (and
+# its connection pool) instead of each building their own
+_llm_cache_lock = threading.Lock()
+
+
+@functools.cache
+def _unverified_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    # Shared by every LLM type with verify_ssl disabled; they usually point at
+    # the same gateway, so they reuse one connection pool instead of one each.
+    return httpx.Client(verify=False), httpx.AsyncClient(verify=False)
 
 
 def _get_config_file_path() -> str:
@@ -118,8 +133,7 @@ def _create_llm_use_conf(llm_type: LLMType, conf: Dict[str, Any]) -> BaseChatMod
 
     # Create custom HTTP client if SSL verification is disabled
     if not verify_ssl:
-        http_client = httpx.Client(verify=False)
-        http_async_client = httpx.AsyncClient(verify=False)
+        http_client, http_async_client = _unverified_http_clients()
         merged_conf["http_client"] = http_client
         merged_conf["http_async_client"] = http_async_client
 
@@ -145,15 +159,23 @@ def get_llm_by_type(llm_type: LLMType) -> BaseChatModel:
     """
     Get LLM instance by type. Returns cached instance if available.
     """
-    if llm_type in _llm_cache:
-        return _llm_cache[llm_type]
-
-    conf = load_yaml_config(_get_config_file_path())
-    llm = _create_llm_use_conf(llm_type, conf)
-    _llm_cache[llm_type] = llm
+    llm = _llm_cache.get(llm_type)
+    if llm is not None:
+        return llm
+
+    with _llm_cache_lock:
+        llm = _llm_cache.get(llm_type)
+        if llm is None:
+            conf = load_yaml_config(_get_config_file_path())
+            llm = _create_llm_use_conf(llm_type, conf)
+            _llm_cache[llm_type] = llm
     return llm
 
 
+# (loaded config dict, model listing built from it)
+_configured_models: tuple[dict, dict[str, list[str]]] | None = None
+
+
 def get_configured_llm_models() -> dict[str, list[str]]:
     """
     Get all configured LLM models grouped by type.
@@ -161,8 +183,14 @@ def get_configured_llm_models() -> dict[str, list[str]]:
     Returns:
         Dictionary mapping LLM type to list of configured model names.
     """
+    global _configured_models
     try:
         conf = load_yaml_config(_get_config_file_path())
+        # load_yaml_config returns the same dict until conf.yaml changes, so
+        # the listing (and its environment scan) is built once per load
+        cached = _configured_models
+        if cached is not None and cached[0] is conf:
+            return cached[1]
         llm_type_config_keys = _get_llm_type_config_keys()
 
         configured_models: dict[str, list[str]] = {}
@@ -183,6 +211,7 @@ def get_configured_llm_models() -> dict[str, list[str]]:
             if model_name:
                 configured_models.setdefault(llm_type, []).append(model_name)
 
+        _configured_models = (conf, configured_models)
         return configured_models
 
     except Exception as e:
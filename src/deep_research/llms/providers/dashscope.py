@@ -65,6 +65,8 @@ from langchain_openai.chat_models.base import (
     warnings,
 )
 
+_SYSTEM_ROLES = frozenset({"system", "developer"})
+
 
 def _convert_delta_to_message_chunk(
     delta_dict: Mapping[str, Any], default_class: Type[BaseMessageChunk]
@@ -125,7 +127,7 @@ def _convert_delta_to_message_chunk(
             id=message_id,
             tool_call_chunks=tool_call_chunks,  # type: ignore[arg-type]
         )
-    elif role in ("system", "developer") or default_class == SystemMessageChunk:
+    elif role in _SYSTEM_ROLES or default_class == SystemMessageChunk:
         if role == "developer":
             additional_kwargs = {"__openai_role__": "developer"}
         return SystemMessageChunk(
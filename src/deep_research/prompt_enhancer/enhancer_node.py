@@ -16,7 +16,7 @@ Key Functions:
 Enhancement Process:
     1. Context Integration: Combines original prompt with additional context
     2. Template Application: Uses prompt_enhancer template for instruction
-    3. Model Invocation: Sends prompt to configured LLM for enhancement
+    3. Model Invocation: Streams the LLM response, stopping at </enhanced_prompt>
     4. Response Parsing: Extracts enhanced prompt using multiple strategies
     5. Error Handling: Falls back to original prompt on failure
 
@@ -47,77 +47,108 @@ import re
 
 from langchain.schema import HumanMessage
 
-from src.deep_research.config.agents import AGENT_LLM_MAP
+from src.deep_research.config.agents import AGENT_LLM_MAP, PROMPT_ENHANCER
 from src.deep_research.llms.llm import get_llm_by_type
 from src.deep_research.prompt_enhancer.state import PromptEnhancerState
 from src.deep_research.prompts.template import apply_prompt_template
 
 logger = logging.getLogger(__name__)
 
+# AGENT_LLM_MAP is read-only, so the enhancer's model type is fixed at import
+_LLM_TYPE = AGENT_LLM_MAP[PROMPT_ENHANCER]
+
+# The tags are literal, so two str.find calls replace a DOTALL regex search
+_OPEN_TAG = "<enhanced_prompt>"
+_CLOSE_TAG = "</enhanced_prompt>"
+
+# Common prefixes that might be added by the model, tried at position 0 in a
+# single match along with the whitespace that follows them
+_PREFIX_RE = re.compile(
+    r"\A(?:\*\*Enhanced [Pp]rompt\*\*:|Enhanced [Pp]rompt:"
+    r"|Here(?:'s| is) the enhanced prompt:)\s*"
+)
+
+
+def _chunk_text(content) -> str:
+    # Some providers stream a list of content blocks instead of a string
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
+
+def _stream_response(model, messages) -> str:
+    """Stream the completion, stopping as soon as the closing tag arrives."""
+    buf = ""
+    scan_from = 0
+    for chunk in model.stream(messages):
+        buf += _chunk_text(chunk.content)
+        if buf.find(_CLOSE_TAG, scan_from) != -1:
+            # Leaving the loop closes the stream; the rest of the generation
+            # is never waited for.
+            break
+        # Re-scan the tail so a tag split across chunks is still found
+        scan_from = max(0, len(buf) - len(_CLOSE_TAG) + 1)
+    return buf
+
 
 def prompt_enhancer_node(state: PromptEnhancerState):
     """Node that enhances user prompts using AI analysis."""
     logger.info("Enhancing user prompt...")
 
-    model = get_llm_by_type(AGENT_LLM_MAP["prompt_enhancer"])
+    prompt = state["prompt"]
+    context = state.get("context")
+    report_style = state.get("report_style")
+    model = get_llm_by_type(_LLM_TYPE)
 
     try:
         # Create messages with context if provided
-        context_info = ""
-        if state.get("context"):
-            context_info = f"\n\nAdditional context: {state['context']}"
-
-        original_prompt_message = HumanMessage(
-            content=f"Please enhance this prompt:{context_info}\n\nOriginal prompt: {state['prompt']}"
-        )
+        if context:
+            content = (
+                f"Please enhance this prompt:\n\nAdditional context: {context}"
+                f"\n\nOriginal prompt: {prompt}"
+            )
+        else:
+            content = f"Please enhance this prompt:\n\nOriginal prompt: {prompt}"
+        original_prompt_message = HumanMessage(content=content)
 
         messages = apply_prompt_template(
             "prompt_enhancer/prompt_enhancer",
             {
                 "messages": [original_prompt_message],
-                "report_style": state.get("report_style"),
+                "report_style": report_style,
             },
         )
 
-        # Get the response from the model
-        response = model.invoke(messages)
-
-        # Extract content from response
-        response_content = response.content.strip()
+        # Stream the response from the model
+        response_content = _stream_response(model, messages).strip()
         logger.debug(f"Response content: {response_content}")
 
         # Try to extract content from XML tags first
-        xml_match = re.search(
-            r"<enhanced_prompt>(.*?)</enhanced_prompt>", response_content, re.DOTALL
+        start = response_content.find(_OPEN_TAG)
+        end = (
+            response_content.find(_CLOSE_TAG, start + len(_OPEN_TAG))
+            if start >= 0
+            else -1
         )
 
-        if xml_match:
+        if end >= 0:
             # Extract content from XML tags and clean it up
-            enhanced_prompt = xml_match.group(1).strip()
+            enhanced_prompt = response_content[start + len(_OPEN_TAG) : end].strip()
             logger.debug("Successfully extracted enhanced prompt from XML tags")
         else:
             # Fallback to original logic if no XML tags found
-            enhanced_prompt = response_content
             logger.warning("No XML tags found in response, using fallback parsing")
 
             # Remove common prefixes that might be added by the model
-            prefixes_to_remove = [
-                "Enhanced Prompt:",
-                "Enhanced prompt:",
-                "Here's the enhanced prompt:",
-                "Here is the enhanced prompt:",
-                "**Enhanced Prompt**:",
-                "**Enhanced prompt**:",
-            ]
-
-            for prefix in prefixes_to_remove:
-                if enhanced_prompt.startswith(prefix):
-                    enhanced_prompt = enhanced_prompt[len(prefix) :].strip()
-                    break
+            enhanced_prompt = _PREFIX_RE.sub("", response_content, count=1)
 
         logger.info("Prompt enhancement completed successfully")
         logger.debug(f"Enhanced prompt: {enhanced_prompt}")
         return {"output": enhanced_prompt}
     except Exception as e:
         logger.error(f"Error in prompt enhancement: {str(e)}")
-        return {"output": state["prompt"]}
+        return {"output": prompt}
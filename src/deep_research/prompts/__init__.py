@@ -9,7 +9,8 @@ Modules:
     template.py: Core prompt template engine using Jinja2
         - get_prompt_template(): Loads and renders prompt templates from .md files
         - apply_prompt_template(): Applies state variables to templates and formats messages
-        - Jinja2 environment configuration with autoescaping and trim settings
+        - apply_prompt_templates(): Batched variant sharing one set of template variables
+        - Jinja2 environment configuration with trim settings and template caching
         
     planner_model.py: Pydantic models for research planning structures
         - StepType: Enum defining research step categories (RESEARCH, PROCESSING)
@@ -46,9 +47,10 @@ across all agents in the Deep Research system.
 # Copyright (c) 2025 charlesxu90
 # SPDX-License-Identifier: MIT
 
-from .template import apply_prompt_template, get_prompt_template
+from .template import apply_prompt_template, apply_prompt_templates, get_prompt_template
 
 __all__ = [
     "apply_prompt_template",
+    "apply_prompt_templates",
     "get_prompt_template",
 ]
@@ -44,7 +44,7 @@ Execution Tracking:
     - need_search flag optimizes search resource usage
 
 Example Schema:
-    The Config class provides example JSON structures demonstrating
+    The model_config json_schema_extra provides example JSON structures demonstrating
     proper plan formatting and expected data patterns for AI model training.
 
 Integration:
@@ -63,7 +63,7 @@ research strategies and execution patterns across different domains.
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StepType(str, Enum):
@@ -88,13 +88,18 @@ class Plan(BaseModel):
     has_enough_context: bool
     thought: str
     title: str
+    # LLM output always supplies steps; pydantic copies a mutable default per
+    # instance itself, so no factory is needed for the rare omitted case
     steps: List[Step] = Field(
-        default_factory=list,
+        default=[],
         description="Research & Processing steps to get more context",
     )
 
-    class Config:
-        json_schema_extra = {
+    # Plans are replaced wholesale on re-planning, never edited in place.
+    # Steps stay mutable: the executing node records execution_res on them.
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "examples": [
                 {
                     "has_enough_context": False,
@@ -114,4 +119,5 @@ class Plan(BaseModel):
                     ],
                 }
             ]
-        }
+        },
+    )
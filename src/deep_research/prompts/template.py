@@ -10,6 +10,7 @@ Key Functions:
         - Loads .md template files from the prompts directory
         - Uses Jinja2 for template processing and rendering
         - Returns rendered template string without variable substitution
+        - Renders each prompt once; later calls return the memoized string
         - Handles template loading errors with descriptive messages
         
     apply_prompt_template(prompt_name, state, configurable): Full template processing
@@ -19,10 +20,19 @@ Key Functions:
         - Returns formatted message list with system prompt and conversation history
         - Handles template rendering errors with comprehensive error reporting
 
+    apply_prompt_templates(prompt_names, state, configurable): Batched variant
+        - Builds the template variables once and renders every named template
+        - Returns one message list per name, in order
+
 Template Processing Features:
-    - Jinja2 Environment: Configured with autoescaping for security
+    - Jinja2 Environment: No autoescaping; prompts are Markdown for LLMs
     - Trim Settings: Removes unnecessary whitespace (trim_blocks, lstrip_blocks)
     - File Loading: FileSystemLoader for .md template files
+    - Template Caching: Compiled templates are memoized per name and never
+      re-checked on disk (auto_reload=False, unbounded cache_size)
+    - Bytecode Cache: Compiled templates are marshalled to a per-user temp
+      directory and reloaded by later processes
+    - Warm Start: Bundled prompts are compiled when the module is imported
     - Variable Injection: Automatic state and configuration merging
     - Time Stamping: Current timestamp injection for time-aware prompts
 
@@ -38,8 +48,9 @@ Message Format:
     2. Conversation history from state["messages"]
 
 Error Handling:
-    - Template loading failures with specific error messages
-    - Rendering failures with context about missing variables
+    - Missing templates are reported as ValueError naming the prompt
+    - Rendering failures (jinja2.TemplateError etc.) propagate unchanged with
+      their original tracebacks
     - Graceful degradation with informative error messages
 
 The template engine enables consistent, maintainable prompt management across
@@ -50,23 +61,71 @@ all agents while supporting dynamic content generation based on workflow state.
 # SPDX-License-Identifier: MIT
 
 import dataclasses
+import logging
 import os
+import time
 from datetime import datetime
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from functools import cache
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateError,
+    TemplateNotFound,
+)
 from langgraph.prebuilt.chat_agent_executor import AgentState
 
 from src.deep_research.config.configuration import Configuration
 
+logger = logging.getLogger(__name__)
+
+# Message keys/role shared by every rendered system message. Identifier-like
+# literals are already interned by the compiler, so these are plain constants.
+_ROLE = "role"
+_CONTENT = "content"
+_SYSTEM = "system"
+
 # Initialize Jinja2 environment
 env = Environment(
     loader=FileSystemLoader(os.path.dirname(__file__)),
-    autoescape=select_autoescape(),
+    # Prompts are Markdown sent to LLMs, not HTML sent to browsers. This only
+    # makes the existing behaviour explicit: select_autoescape() never
+    # escaped .md templates either.
+    autoescape=False,
     trim_blocks=True,
     lstrip_blocks=True,
+    # Prompt files don't change at runtime: keep every compiled template and
+    # skip the per-lookup uptodate() stat
+    auto_reload=False,
+    cache_size=-1,
+    # Persist compiled bytecode so fresh processes skip parse + compile. With
+    # no directory Jinja uses a private per-user dir under the system temp dir.
+    bytecode_cache=FileSystemBytecodeCache(pattern="deep_research_%s.cache"),
 )
 
 
+# (epoch second, formatted CURRENT_TIME) of the last render
+_current_time_cache: tuple[int, str] = (0, "")
+
+
+def _current_time() -> str:
+    # The formatted value only changes once per second; bursts of renders
+    # within the same second reuse it instead of calling strftime again.
+    global _current_time_cache
+    now = int(time.time())
+    cached_at, formatted = _current_time_cache
+    if cached_at != now:
+        formatted = datetime.now().strftime("%a %b %d %Y %H:%M:%S %z")
+        _current_time_cache = (now, formatted)
+    return formatted
+
+
+@cache
+def _get_template(prompt_name: str):
+    return env.get_template(f"{prompt_name}.md")
+
+
 def get_prompt_template(prompt_name: str) -> str:
     """
     Load and return a prompt template using Jinja2.
@@ -77,11 +136,18 @@ def get_prompt_template(prompt_name: str) -> str:
     Returns:
         The template string with proper variable substitution syntax
     """
+    return _render_without_variables(prompt_name)
+
+
+@cache
+def _render_without_variables(prompt_name: str) -> str:
+    # With no variables the output depends only on the (immutable) file, so
+    # each prompt is rendered once. Failures raise and are not cached.
     try:
-        template = env.get_template(f"{prompt_name}.md")
+        template = _get_template(prompt_name)
         return template.render()
-    except Exception as e:
-        raise ValueError(f"Error loading template {prompt_name}: {e}")
+    except TemplateNotFound as e:
+        raise ValueError(f"Error loading template {prompt_name}: {e}") from e
 
 
 def apply_prompt_template(
@@ -97,19 +163,83 @@ def apply_prompt_template(
     Returns:
         List of messages with the system prompt as the first message
     """
+    state_vars = _build_template_vars(state, configurable)
+
+    try:
+        return _render_messages(prompt_name, state_vars, state["messages"])
+    except TemplateNotFound as e:
+        raise ValueError(f"Error applying template {prompt_name}: {e}") from e
+
+
+def apply_prompt_templates(
+    prompt_names: list[str], state: AgentState, configurable: Configuration = None
+) -> list[list]:
+    """
+    Render several templates against the same state in one call.
+
+    The template variables (state merge, CURRENT_TIME, configuration fields)
+    are built once and shared by every render.
+
+    Args:
+        prompt_names: Names of the prompt templates to use
+        state: Current agent state containing variables to substitute
+        configurable: Optional configuration whose fields are also exposed
+
+    Returns:
+        One message list per prompt name, in the same order
+    """
+    state_vars = _build_template_vars(state, configurable)
+    messages = state["messages"]
+
+    results = []
+    for prompt_name in prompt_names:
+        try:
+            results.append(_render_messages(prompt_name, state_vars, messages))
+        except TemplateNotFound as e:
+            raise ValueError(f"Error applying template {prompt_name}: {e}") from e
+    return results
+
+
+def _build_template_vars(state: AgentState, configurable: Configuration | None) -> dict:
     # Convert state to dict for template rendering
     state_vars = {
-        "CURRENT_TIME": datetime.now().strftime("%a %b %d %Y %H:%M:%S %z"),
+        "CURRENT_TIME": _current_time(),
         **state,
     }
 
     # Add configurable variables
     if configurable:
-        state_vars.update(dataclasses.asdict(configurable))
+        # Shallow field view: asdict() deep-copies every value, and Jinja only
+        # reads them. Configuration uses slots, so there is no __dict__.
+        for field in dataclasses.fields(configurable):
+            state_vars[field.name] = getattr(configurable, field.name)
+    return state_vars
+
+
+def _render_messages(prompt_name: str, state_vars: dict, messages: list) -> list:
+    template = _get_template(prompt_name)
+    # Pass the mapping positionally: **-unpacking would build yet another
+    # copy of every state key before Jinja copies it into its context
+    system_prompt = template.render(state_vars)
+    # Unpack into one list instead of concatenating two
+    return [{_ROLE: _SYSTEM, _CONTENT: system_prompt}, *messages]
+
+
+# Every prompt shipped with the package; compiled at import so the first
+# request for each one doesn't pay parse + compile (or bytecode load) latency
+_KNOWN_TEMPLATES = (
+    "coordinator",
+    "planner",
+    "researcher",
+    "reporter",
+    "coder",
+    "prompt_enhancer/prompt_enhancer",
+    "ppt/ppt_composer",
+)
 
+for _name in _KNOWN_TEMPLATES:
     try:
-        template = env.get_template(f"{prompt_name}.md")
-        system_prompt = template.render(**state_vars)
-        return [{"role": "system", "content": system_prompt}] + state["messages"]
-    except Exception as e:
-        raise ValueError(f"Error applying template {prompt_name}: {e}")
+        _get_template(_name)
+    except TemplateError as e:
+        # Don't fail the import; the error resurfaces when the prompt is used
+        logger.warning(f"Failed to precompile prompt template {_name}: {e}")
@@ -35,7 +35,7 @@ Key Classes:
         - id, url, title: Document metadata
         - chunks: List of content chunks with similarity scores
         - to_dict(): Serialization for workflow integration
-        
+
     Resource: External knowledge resource representation
         - uri: Unique resource identifier (with custom schemes)
         - title, description: Human-readable metadata
@@ -68,10 +68,32 @@ supporting the Deep Research system's need for comprehensive information gatheri
 and context-aware research assistance.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .builder import build_retriever
-from .ragflow import RAGFlowProvider
 from .retriever import Chunk, Document, Resource, Retriever
-from .vikingdb_knowledge_base import VikingDBKnowledgeBaseProvider
+
+if TYPE_CHECKING:
+    from .ragflow import RAGFlowProvider
+    from .vikingdb_knowledge_base import VikingDBKnowledgeBaseProvider
+
+# Provider modules pull in HTTP clients and request-signing code, so they are
+# only imported on first attribute access (PEP 562).
+_LAZY_ATTRS = {
+    "RAGFlowProvider": "ragflow",
+    "VikingDBKnowledgeBaseProvider": "vikingdb_knowledge_base",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Retriever",
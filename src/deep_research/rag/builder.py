@@ -10,6 +10,8 @@ Key Functions:
         - Reads SELECTED_RAG_PROVIDER from environment configuration
         - Instantiates appropriate provider based on configuration
         - Returns configured Retriever instance or None if not configured
+        - Memoized: the provider is built once; build_retriever.cache_clear()
+          rebuilds it after configuration changes
         - Handles provider validation and error reporting
 
 Supported Providers:
@@ -37,7 +39,7 @@ Factory Pattern Benefits:
 
 Error Handling:
     - Returns None for unconfigured RAG (allowing workflows to continue)
-    - Raises ValueError for unknown provider types
+    - Unknown RAG_PROVIDER values are rejected (with a warning) at config import
     - Provider-specific configuration errors bubble up from constructors
     - Clear error messages for debugging configuration issues
 
@@ -54,17 +56,25 @@ deployment scenarios and provider preferences.
 
 # 
 
+import functools
+
 from src.deep_research.config.tools import SELECTED_RAG_PROVIDER, RAGProvider
-from src.deep_research.rag.ragflow import RAGFlowProvider
 from src.deep_research.rag.retriever import Retriever
-from src.deep_research.rag.vikingdb_knowledge_base import VikingDBKnowledgeBaseProvider
 
 
+# Providers only hold credentials read from the environment, so one instance
+# is shared by every caller. build_retriever.cache_clear() forces a rebuild.
+@functools.lru_cache(maxsize=1)
 def build_retriever() -> Retriever | None:
-    if SELECTED_RAG_PROVIDER == RAGProvider.RAGFLOW.value:
+    # Provider modules are imported only for the provider actually selected
+    if SELECTED_RAG_PROVIDER is RAGProvider.RAGFLOW:
+        from src.deep_research.rag.ragflow import RAGFlowProvider
+
         return RAGFlowProvider()
-    elif SELECTED_RAG_PROVIDER == RAGProvider.VIKINGDB_KNOWLEDGE_BASE.value:
+    elif SELECTED_RAG_PROVIDER is RAGProvider.VIKINGDB_KNOWLEDGE_BASE:
+        from src.deep_research.rag.vikingdb_knowledge_base import (
+            VikingDBKnowledgeBaseProvider,
+        )
+
         return VikingDBKnowledgeBaseProvider()
-    elif SELECTED_RAG_PROVIDER:
-        raise ValueError(f"Unsupported RAG provider: {SELECTED_RAG_PROVIDER}")
     return None
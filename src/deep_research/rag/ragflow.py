@@ -33,6 +33,11 @@ RAGFlow API Integration:
     - Environment-based configuration (RAGFLOW_API_URL, RAGFLOW_API_KEY)
     - Configurable page size for result pagination
     - Optional cross-language search capabilities
+    - Shared keep-alive requests.Session (pooled, GETs retried) across providers
+    - aquery_relevant_documents(): Async query on the shared per-event-loop
+      httpx client from tools._http, so concurrent queries overlap
+    - Large result pages (page_size >= 50) are parsed incrementally from the
+      socket with ijson
 
 Authentication:
     - Bearer token authentication using API key
@@ -71,13 +76,60 @@ Research system.
 
 # 
 
+import functools
 import os
-from typing import List, Optional
-from urllib.parse import urlparse
+import re
+from typing import Any, Iterable, Iterator, List, Optional
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson comes in via langsmith but is not required
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+import httpx
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.deep_research.rag.retriever import Chunk, Document, Resource, Retriever
+from src.deep_research.tools._http import async_client
+
+
+# rag://dataset/<dataset_id>[/...][#<document_id>], matched directly instead
+# of going through urllib's general-purpose urlparse
+_RAG_URI_RE = re.compile(r"rag://[^/]*/([^/?#]+)[^#]*(?:#(.*))?", re.DOTALL)
+
+
+# Result pages at least this large are parsed incrementally
+_STREAM_MIN_PAGE_SIZE = 50
+_STREAM_PREFIXES = frozenset({"data.chunks.item", "data.doc_aggs.item"})
+
+
+@functools.cache
+def _session() -> requests.Session:
+    # Providers are built per request, so the pool lives at module level to
+    # keep TCP/TLS connections to RAGFlow alive across them.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_QUERY_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
 
 class RAGFlowProvider(Retriever):
@@ -110,14 +162,45 @@ class RAGFlowProvider(Retriever):
         if cross_languages:
             self.cross_languages = cross_languages.split(",")
 
-    def query_relevant_documents(
-        self, query: str, resources: list[Resource] = []
-    ) -> list[Document]:
-        headers = {
+        self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
 
+    def query_relevant_documents(
+        self, query: str, resources: list[Resource] = []
+    ) -> list[Document]:
+        stream = self.page_size >= _STREAM_MIN_PAGE_SIZE
+        with _session().post(
+            f"{self.api_url}/api/v1/retrieval",
+            headers=self._headers,
+            data=_dumps(self._build_payload(query, resources)),
+            stream=stream,
+        ) as response:
+            if response.status_code != 200:
+                raise Exception(f"Failed to query documents: {response.text}")
+
+            if stream:
+                response.raw.decode_content = True
+                return _parse_documents_stream(response.raw)
+            return _parse_documents(_loads(response.content))
+
+    async def aquery_relevant_documents(
+        self, query: str, resources: list[Resource] | None = None
+    ) -> list[Document]:
+        response = await async_client().post(
+            f"{self.api_url}/api/v1/retrieval",
+            headers=self._headers,
+            content=_dumps(self._build_payload(query, resources or [])),
+            timeout=_QUERY_TIMEOUT,
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to query documents: {response.text}")
+
+        return _parse_documents(_loads(response.content))
+
+    def _build_payload(self, query: str, resources: list[Resource]) -> dict:
         dataset_ids: list[str] = []
         document_ids: list[str] = []
 
@@ -136,56 +219,21 @@ class RAGFlowProvider(Retriever):
 
         if self.cross_languages:
             payload["cross_languages"] = self.cross_languages
-
-        response = requests.post(
-            f"{self.api_url}/api/v1/retrieval", headers=headers, json=payload
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to query documents: {response.text}")
-
-        result = response.json()
-        data = result.get("data", {})
-        doc_aggs = data.get("doc_aggs", [])
-        docs: dict[str, Document] = {
-            doc.get("doc_id"): Document(
-                id=doc.get("doc_id"),
-                title=doc.get("doc_name"),
-                chunks=[],
-            )
-            for doc in doc_aggs
-        }
-
-        for chunk in data.get("chunks", []):
-            doc = docs.get(chunk.get("document_id"))
-            if doc:
-                doc.chunks.append(
-                    Chunk(
-                        content=chunk.get("content"),
-                        similarity=chunk.get("similarity"),
-                    )
-                )
-
-        return list(docs.values())
+        return payload
 
     def list_resources(self, query: str | None = None) -> list[Resource]:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
         params = {}
         if query:
             params["name"] = query
 
-        response = requests.get(
-            f"{self.api_url}/api/v1/datasets", headers=headers, params=params
+        response = _session().get(
+            f"{self.api_url}/api/v1/datasets", headers=self._headers, params=params
         )
 
         if response.status_code != 200:
             raise Exception(f"Failed to list resources: {response.text}")
 
-        result = response.json()
+        result = _loads(response.content)
         resources = []
 
         for item in result.get("data", []):
@@ -199,8 +247,74 @@ class RAGFlowProvider(Retriever):
         return resources
 
 
+def _parse_documents(result: dict) -> list[Document]:
+    data = result.get("data", {})
+    doc_names = {
+        doc.get("doc_id"): doc.get("doc_name") for doc in data.get("doc_aggs", [])
+    }
+    return _group_chunks(data.get("chunks", []), doc_names)
+
+
+def _parse_documents_stream(raw) -> list[Document]:
+    # Chunks are turned into Documents as they are decoded from the socket,
+    # so neither the raw body nor the full JSON tree is held in memory.
+    # use_float keeps similarities as float, matching the buffered path.
+    doc_names: dict[str, str] = {}
+
+    def chunks() -> Iterator[dict]:
+        for prefix, item in _iter_json_items(
+            ijson.parse(raw, use_float=True), _STREAM_PREFIXES
+        ):
+            if prefix == "data.doc_aggs.item":
+                doc_names[item.get("doc_id")] = item.get("doc_name")
+            else:
+                yield item
+
+    return _group_chunks(chunks(), doc_names)
+
+
+def _iter_json_items(events, prefixes: frozenset[str]) -> Iterator[tuple[str, Any]]:
+    """Yield (prefix, value) for every complete JSON value found at one of prefixes."""
+    events = iter(events)
+    for prefix, event, value in events:
+        if prefix not in prefixes:
+            continue
+        if event not in ("start_map", "start_array"):
+            yield prefix, value
+            continue
+        builder = ijson.ObjectBuilder()
+        depth = 1
+        builder.event(event, value)
+        while depth:
+            _, event, value = next(events)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            builder.event(event, value)
+        yield prefix, builder.value
+
+
+def _group_chunks(chunks: Iterable[dict], doc_names: dict[str, str]) -> list[Document]:
+    # Chunks are bucketed by document id first: when streaming, doc_aggs may
+    # follow the chunks. Documents then come out in doc_aggs order, and chunks
+    # of documents not listed in doc_aggs are dropped.
+    grouped: dict[str, list[Chunk]] = {}
+    for chunk in chunks:
+        grouped.setdefault(chunk.get("document_id"), []).append(
+            Chunk(
+                content=chunk.get("content"),
+                similarity=chunk.get("similarity"),
+            )
+        )
+    return [
+        Document(id=doc_id, title=title, chunks=grouped.get(doc_id, []))
+        for doc_id, title in doc_names.items()
+    ]
+
+
 def parse_uri(uri: str) -> tuple[str, str]:
-    parsed = urlparse(uri)
-    if parsed.scheme != "rag":
+    match = _RAG_URI_RE.match(uri)
+    if not match:
         raise ValueError(f"Invalid URI: {uri}")
-    return parsed.path.split("/")[1], parsed.fragment
+    return match.group(1), match.group(2) or ""
@@ -10,6 +10,7 @@ Key Classes:
         - content: str - The actual text content of the chunk
         - similarity: float - Relevance score (0.0 to 1.0) for ranking
         - Used for fine-grained content retrieval and ranking
+        - Slotted dataclass: no per-instance __dict__
         
     Document: Complete document structure with metadata and content chunks
         - id: str - Unique document identifier within the provider
@@ -17,16 +18,24 @@ Key Classes:
         - title: Optional[str] - Human-readable document title
         - chunks: List[Chunk] - Ordered list of content segments
         - to_dict(): Serialization method for workflow integration
-        
+        - Slotted dataclass; each instance gets its own chunks list
+        - to_json_bytes(): to_dict() serialized with orjson (stdlib fallback)
+
     Resource: External knowledge base or dataset representation
         - uri: str - Unique resource identifier (custom URI schemes supported)
         - title: str - Human-readable resource name
         - description: Optional[str] - Resource description and metadata
         - Pydantic model with validation for API integration
+        - Frozen (immutable, hashable); unknown fields are ignored
         
     Retriever: Abstract base class defining RAG provider interface
         - list_resources(): Abstract method for resource discovery
         - query_relevant_documents(): Abstract method for document search
+        - aquery_relevant_documents(): Async search; defaults to a worker thread
+
+Key Functions:
+    dump_documents(documents): JSON array of Document.to_dict() forms, as bytes
+        - One orjson call for the whole result list (stdlib json fallback)
 
 Data Flow:
     1. Resource Discovery: list_resources() finds available knowledge bases
@@ -64,19 +73,30 @@ to work with any RAG provider through a consistent interface.
 # 
 
 import abc
+import asyncio
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from pydantic import BaseModel, ConfigDict, Field
 
-from pydantic import BaseModel, Field
+try:
+    import orjson
 
+    _dumps = orjson.dumps
+except ImportError:  # orjson comes in via langsmith but is not required
+    import json
 
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
+
+@dataclass(slots=True)
 class Chunk:
     content: str
     similarity: float
 
-    def __init__(self, content: str, similarity: float):
-        self.content = content
-        self.similarity = similarity
-
 
+@dataclass(slots=True)
 class Document:
     """
     Document is a class that represents a document.
@@ -85,30 +105,28 @@ class Document:
     id: str
     url: str | None = None
     title: str | None = None
-    chunks: list[Chunk] = []
-
-    def __init__(
-        self,
-        id: str,
-        url: str | None = None,
-        title: str | None = None,
-        chunks: list[Chunk] = [],
-    ):
-        self.id = id
-        self.url = url
-        self.title = title
-        self.chunks = chunks
+    chunks: list[Chunk] = field(default_factory=list)
+
+    def to_json_bytes(self) -> bytes:
+        return _dumps(self.to_dict())
 
     def to_dict(self) -> dict:
-        d = {
-            "id": self.id,
-            "content": "\n\n".join([chunk.content for chunk in self.chunks]),
-        }
-        if self.url:
-            d["url"] = self.url
-        if self.title:
-            d["title"] = self.title
-        return d
+        # One dict literal per metadata shape. The shape is read per call, not
+        # fixed at construction: providers fill in titles after grouping chunks.
+        content = "\n\n".join(chunk.content for chunk in self.chunks)
+        url, title = self.url, self.title
+        if not url and not title:
+            return {"id": self.id, "content": content}
+        if url and title:
+            return {"id": self.id, "content": content, "url": url, "title": title}
+        if url:
+            return {"id": self.id, "content": content, "url": url}
+        return {"id": self.id, "content": content, "title": title}
+
+
+def dump_documents(documents: Iterable[Document]) -> bytes:
+    """Serialize documents as a JSON array of their to_dict() forms in one call."""
+    return _dumps([doc.to_dict() for doc in documents])
 
 
 class Resource(BaseModel):
@@ -116,6 +134,9 @@ class Resource(BaseModel):
     Resource is a class that represents a resource.
     """
 
+    # Resources are passed around as immutable values (and can be hashed)
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     uri: str = Field(..., description="The URI of the resource")
     title: str = Field(..., description="The title of the resource")
     description: str | None = Field("", description="The description of the resource")
@@ -141,3 +162,16 @@ class Retriever(abc.ABC):
         Query relevant documents from the resources.
         """
         pass
+
+    async def aquery_relevant_documents(
+        self, query: str, resources: list[Resource] | None = None
+    ) -> list[Document]:
+        """
+        Query relevant documents from the resources without blocking the loop.
+
+        Providers with a native async client override this; the default runs
+        the sync query in a worker thread so concurrent queries overlap.
+        """
+        return await asyncio.to_thread(
+            self.query_relevant_documents, query, resources or []
+        )
@@ -10,6 +10,9 @@ Available Tools:
         - Crawls URLs and extracts readable content in markdown format
         - Handles various content types including articles, PDFs, and structured data
         - Returns formatted content suitable for further analysis
+        - Async-capable: ainvoke() awaits the pooled async crawler
+
+    acrawl: Plain async crawl function behind crawl_tool.ainvoke()
         
     python_repl_tool: Code execution and data analysis
         - Executes Python code in a secure sandboxed environment
@@ -20,6 +23,7 @@ Available Tools:
         - Factory function for creating configured search tools
         - Supports multiple search engines (Tavily, DuckDuckGo, Brave, ArXiv, Wikipedia)
         - Configurable result limits and filtering options
+        - Returned tool coalesces identical concurrent queries (BatchingSearchTool)
         
     get_retriever_tool(): Document retrieval from knowledge bases
         - Creates RAG-based document retrieval tools
@@ -51,7 +55,7 @@ ecosystem, providing agents with the capabilities needed for comprehensive
 automated research and analysis.
 """
 
-from .crawl import crawl_tool
+from .crawl import acrawl, crawl_tool
 from .python_repl import python_repl_tool
 from .retriever import get_retriever_tool
 from .search import get_web_search_tool
@@ -59,6 +63,7 @@ from .search import get_web_search_tool
 
 __all__ = [
     "crawl_tool",
+    "acrawl",
     "python_repl_tool",
     "get_web_search_tool",
     "get_retriever_tool",
@@ -0,0 +1,68 @@
+"""
+Shared HTTP Clients for Search Tools
+
+Search backends are called many times per research run, and opening a fresh
+session per request pays the TCP and TLS handshake every time. This module
+owns the connection pools that the search tool wrappers reuse; the async
+client is also shared by the crawler and the RAGFlow provider, so the single
+aclose_async_client() call at server shutdown releases all of them.
+
+Key Functions:
+    sync_session(): Process-wide requests.Session with a pooled adapter
+    async_client(): httpx.AsyncClient for the running event loop
+        - HTTP/2 when the optional h2 package is installed, so concurrent
+          queries multiplex over one connection; keep-alive HTTP/1.1 otherwise
+        - trust_env is left on, matching the aiohttp sessions it replaces
+    aclose_async_client(): Closes the running loop's client (server shutdown)
+
+Design Notes:
+    - An httpx pool is bound to the loop it was first used on, so clients are
+      kept per event loop in a WeakKeyDictionary rather than as one global
+"""
+
+import asyncio
+import functools
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@functools.cache
+def sync_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=64)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:  # HTTP/2 needs the optional h2 package
+            http2 = False
+        client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=64, max_connections=128
+            ),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,100 @@
+"""
+Request Coalescing Wrapper for Search Tools
+
+Research agents fan out many sub-queries at once, and parallel tool calls from
+one or several agents frequently repeat the same query. This module wraps a
+search tool so concurrent async calls share work and stay within a bounded
+number of in-flight requests, while keeping the wrapped tool's LangChain
+interface (name, description, args schema and response format).
+
+Key Classes:
+    BatchingSearchTool: BaseTool wrapper around a single-query search tool
+        - wrap(inner, max_concurrency): Builds a wrapper that mirrors inner
+        - _arun(): Identical queries already in flight on the running event
+          loop await the same request instead of issuing another one
+        - At most max_concurrency distinct queries hit the backend at a time
+        - _run(): Sync calls go straight to the wrapped tool
+
+Design Notes:
+    - Per-event-loop state (in-flight tasks and the semaphore) lives in a
+      WeakKeyDictionary, since asyncio primitives are bound to their loop
+    - The shared request is shielded, so one cancelled caller does not cancel
+      the request for the others
+    - There is no time-window batching: none of the supported engines has a
+      multi-query endpoint, so holding queries back would only add latency
+"""
+
+import asyncio
+import weakref
+from typing import Any, Optional
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class BatchingSearchTool(BaseTool):
+    """Search tool wrapper that coalesces concurrent identical queries."""
+
+    inner: BaseTool
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+
+    # event loop -> (query -> in-flight task, concurrency semaphore)
+    _loop_state: weakref.WeakKeyDictionary = PrivateAttr(
+        default_factory=weakref.WeakKeyDictionary
+    )
+
+    @classmethod
+    def wrap(
+        cls, inner: BaseTool, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> "BatchingSearchTool":
+        return cls(
+            name=inner.name,
+            description=inner.description,
+            args_schema=inner.args_schema,
+            response_format=inner.response_format,
+            inner=inner,
+            max_concurrency=max_concurrency,
+        )
+
+    def _run(
+        self,
+        query: str,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> Any:
+        return self.inner._run(query, run_manager=run_manager)
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.get(loop)
+        if state is None:
+            state = self._loop_state[loop] = (
+                {},
+                asyncio.Semaphore(self.max_concurrency),
+            )
+        in_flight, semaphore = state
+
+        task = in_flight.get(query)
+        if task is None:
+            task = loop.create_task(self._dispatch(semaphore, query, run_manager))
+            in_flight[query] = task
+            task.add_done_callback(lambda _: in_flight.pop(query, None))
+        return await asyncio.shield(task)
+
+    async def _dispatch(
+        self,
+        semaphore: asyncio.Semaphore,
+        query: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun],
+    ) -> Any:
+        async with semaphore:
+            return await self.inner._arun(query, run_manager=run_manager)
@@ -6,21 +6,26 @@ from URLs. It integrates with the Deep Research crawler system to provide clean,
 readable content in markdown format for further analysis.
 
 Key Functions:
-    crawl_tool(url): Main web crawling function decorated as a LangChain tool
+    crawl_tool(url): Main web crawling LangChain tool
         - Accepts a URL parameter for content extraction
-        - Uses the Deep Research Crawler for robust content processing
+        - Runs crawl() on invoke and awaits acrawl() on ainvoke
+        - Uses a shared, lazily created Crawler for robust content processing
         - Returns structured data with URL and crawled content
         - Handles errors gracefully with detailed error reporting
 
+    crawl(url) / acrawl(url): Sync and async implementations behind crawl_tool
+        - acrawl fetches on a per-event-loop pooled httpx.AsyncClient
+
 Crawling Features:
     - URL Content Extraction: Retrieves and processes web page content
     - Markdown Conversion: Converts HTML content to clean markdown format
-    - Content Truncation: Limits output to 1000 characters for efficiency
+    - Content Truncation: Limits output to MAX_CONTENT_CHARS (1000); only as
+      much HTML is converted as that needs
     - Error Handling: Comprehensive exception handling with logging
     - Structured Output: Returns JSON-like structure with URL and content
 
 Technical Implementation:
-    - LangChain Tool Integration: Decorated with @tool for agent compatibility
+    - LangChain Tool Integration: StructuredTool with sync and async entry points
     - Logging Integration: Enhanced with @log_io decorator for monitoring
     - Type Annotations: Fully typed with Annotated types for validation
     - Crawler Integration: Uses src.deep_research.crawler.Crawler class
@@ -32,9 +37,10 @@ Content Processing:
     - Content Filtering: Focuses on main article content
 
 Error Handling:
-    - Exception Catching: Catches all BaseException types for robustness
+    - Exception Catching: Catches Exception; KeyboardInterrupt, SystemExit and
+      task cancellation propagate
     - Error Logging: Detailed error logging for debugging
-    - Graceful Degradation: Returns error messages instead of crashing
+    - Graceful Degradation: Returns {"url", "error"} instead of crashing
     - User Feedback: Clear error messages for troubleshooting
 
 Usage in Research Workflow:
@@ -49,9 +55,10 @@ by downstream research tools and LLM models.
 """
 
 import logging
+import threading
 from typing import Annotated
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
 from src.deep_research.crawler import Crawler
 
@@ -59,18 +66,59 @@ from .decorators import log_io
 
 logger = logging.getLogger(__name__)
 
+# Characters of markdown returned per crawl
+MAX_CONTENT_CHARS = 1000
+
+_crawler: Crawler | None = None
+_crawler_lock = threading.Lock()
+
+
+def _get_crawler() -> Crawler:
+    """Return the process-wide Crawler, creating it on first use."""
+    global _crawler
+    if _crawler is None:
+        with _crawler_lock:
+            if _crawler is None:
+                _crawler = Crawler()
+    return _crawler
+
 
-@tool
 @log_io
-def crawl_tool(
+def crawl(
     url: Annotated[str, "The url to crawl."],
 ) -> str:
     """Use this to crawl a url and get a readable content in markdown format."""
     try:
-        crawler = Crawler()
+        crawler = _get_crawler()
         article = crawler.crawl(url)
-        return {"url": url, "crawled_content": article.to_markdown()[:1000]}
-    except BaseException as e:
-        error_msg = f"Failed to crawl. Error: {repr(e)}"
-        logger.error(error_msg)
-        return error_msg
+        return {
+            "url": url,
+            "crawled_content": article.to_markdown(max_chars=MAX_CONTENT_CHARS),
+        }
+    except Exception as e:
+        logger.error(f"Failed to crawl {url}. Error: {e!r}")
+        return {"url": url, "error": repr(e)}
+
+
+@log_io
+async def acrawl(
+    url: Annotated[str, "The url to crawl."],
+) -> str:
+    """Use this to crawl a url and get a readable content in markdown format."""
+    try:
+        crawler = _get_crawler()
+        article = await crawler.acrawl(url)
+        markdown = await article.to_markdown_async(max_chars=MAX_CONTENT_CHARS)
+        return {"url": url, "crawled_content": markdown}
+    except Exception as e:
+        logger.error(f"Failed to crawl {url}. Error: {e!r}")
+        return {"url": url, "error": repr(e)}
+
+
+# One tool carrying both paths: invoke() runs crawl, ainvoke() awaits acrawl,
+# so parallel tool calls from an async agent overlap their fetches.
+crawl_tool = StructuredTool.from_function(
+    func=crawl,
+    coroutine=acrawl,
+    name="crawl_tool",
+)
@@ -11,16 +11,20 @@ Key Functions:
         - Preserves function metadata using functools.wraps
         - Provides comprehensive debugging information
         - Non-intrusive logging that doesn't affect function behavior
+        - Coroutine functions get an async wrapper so the result is awaited
+        - Skips formatting unless INFO is enabled; results are cut to 512 chars
         
     create_logged_tool(base_tool_class): Factory for creating logged tool classes
         - Creates new classes that inherit from LoggedToolMixin and base tool
         - Adds logging capabilities to any existing tool class
         - Maintains original class functionality while adding instrumentation
         - Returns enhanced tool class with descriptive naming
+        - DEEP_RESEARCH_LOG_TOOLS=0 returns the base class unwrapped
 
 Key Classes:
     LoggedToolMixin: Mixin class for adding logging to tool classes
         - Provides _log_operation() helper for consistent operation logging
+        - Skips formatting entirely unless DEBUG logging is enabled
         - Overrides _run() method to add automatic logging
         - Integrates with LangChain tool patterns
         - Maintains backward compatibility with existing tools
@@ -85,13 +89,32 @@ Deep Research tool ecosystem.
 """
 
 import functools
+import inspect
 import logging
+import os
 from typing import Any, Callable, Type, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# DEEP_RESEARCH_LOG_TOOLS=0 makes create_logged_tool return the base class
+# unchanged, removing the wrapper frames entirely. Read once at import.
+_LOG_TOOLS = os.getenv("DEEP_RESEARCH_LOG_TOOLS", "1").lower() not in (
+    "0",
+    "false",
+    "no",
+    "off",
+)
+
+# Tool results (crawled pages, REPL output) can be large; log only a prefix
+_MAX_LOGGED_RESULT = 512
+
+
+def _truncate(value: Any, limit: int = _MAX_LOGGED_RESULT) -> str:
+    text = str(value)
+    return text if len(text) <= limit else f"{text[:limit]}…"
+
 
 def log_io(func: Callable) -> Callable:
     """
@@ -104,20 +127,41 @@ def log_io(func: Callable) -> Callable:
         The wrapped function with input/output logging
     """
 
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # Log input parameters
-        func_name = func.__name__
+    func_name = func.__name__
+
+    def _log_call(args: tuple, kwargs: dict) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            return
         params = ", ".join(
             [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
         )
         logger.info(f"Tool {func_name} called with parameters: {params}")
 
+    def _log_result(result: Any) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Tool {func_name} returned: {_truncate(result)}")
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            _log_call(args, kwargs)
+            result = await func(*args, **kwargs)
+            _log_result(result)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Log input parameters
+        _log_call(args, kwargs)
+
         # Execute the function
         result = func(*args, **kwargs)
 
         # Log the output
-        logger.info(f"Tool {func_name} returned: {result}")
+        _log_result(result)
 
         return result
 
@@ -127,21 +171,29 @@ def log_io(func: Callable) -> Callable:
 class LoggedToolMixin:
     """A mixin class that adds logging functionality to any tool."""
 
+    # Class name without the "Logged" prefix, computed once per class
+    _tool_display_name: str = ""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._tool_display_name = cls.__name__.replace("Logged", "")
+
     def _log_operation(self, method_name: str, *args: Any, **kwargs: Any) -> None:
         """Helper method to log tool operations."""
-        tool_name = self.__class__.__name__.replace("Logged", "")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         params = ", ".join(
             [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
         )
+        tool_name = self._tool_display_name
         logger.debug(f"Tool {tool_name}.{method_name} called with parameters: {params}")
 
     def _run(self, *args: Any, **kwargs: Any) -> Any:
         """Override _run method to add logging."""
         self._log_operation("_run", *args, **kwargs)
         result = super()._run(*args, **kwargs)
-        logger.debug(
-            f"Tool {self.__class__.__name__.replace('Logged', '')} returned: {result}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tool {self._tool_display_name} returned: {result}")
         return result
 
 
@@ -153,12 +205,16 @@ def create_logged_tool(base_tool_class: Type[T]) -> Type[T]:
         base_tool_class: The original tool class to be enhanced with logging
 
     Returns:
-        A new class that inherits from both LoggedToolMixin and the base tool class
+        A new class that inherits from both LoggedToolMixin and the base tool
+        class, or base_tool_class itself when tool logging is switched off
     """
+    if not _LOG_TOOLS:
+        return base_tool_class
 
     class LoggedTool(LoggedToolMixin, base_tool_class):
         pass
 
     # Set a more descriptive name for the class
     LoggedTool.__name__ = f"Logged{base_tool_class.__name__}"
+    LoggedTool._tool_display_name = base_tool_class.__name__
     return LoggedTool
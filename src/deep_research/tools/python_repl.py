@@ -11,6 +11,10 @@ Key Functions:
         - Supports multiple truthy formats ("true", "1", "yes", "on")
         - Returns boolean indicating if tool should be active
         - Used for security-conscious deployments
+        - Evaluated once at import and stored in _REPL_ENABLED
+
+    _get_repl(): Lazily creates the shared PythonREPL on the first tool call
+        - Keeps langchain_experimental off the import path
         
     python_repl_tool(code): Main code execution function
         - Executes Python code in isolated REPL environment
@@ -34,14 +38,15 @@ Execution Capabilities:
 
 Output Formatting:
     - Structured Results: Formatted output with code block and results
-    - Error Reporting: Clear error messages with code context
+    - Error Reporting: Failures return {"error": ..., "code": ...}
     - Status Indication: Success/failure status in response
     - User Visibility: Print statements appear in output for user feedback
 
 Error Handling:
     - Configuration Errors: Graceful handling when tool is disabled
     - Type Validation: Input type checking with informative errors
-    - Execution Errors: Python exception catching and reporting
+    - Execution Errors: Exception and SystemExit are caught and reported;
+      KeyboardInterrupt propagates
     - Logging Integration: Comprehensive logging for monitoring and debugging
 
 Tool Integration:
@@ -64,13 +69,17 @@ the research workflow while maintaining security and isolation.
 
 import logging
 import os
-from typing import Annotated, Optional
+import re
+import threading
+from typing import TYPE_CHECKING, Annotated, Optional
 
 from langchain_core.tools import tool
-from langchain_experimental.utilities import PythonREPL
 
 from .decorators import log_io
 
+if TYPE_CHECKING:
+    from langchain_experimental.utilities import PythonREPL
+
 
 def _is_python_repl_enabled() -> bool:
     """Check if Python REPL tool is enabled from configuration."""
@@ -81,11 +90,32 @@ def _is_python_repl_enabled() -> bool:
     return False
 
 
-# Initialize REPL and logger
-repl: Optional[PythonREPL] = PythonREPL() if _is_python_repl_enabled() else None
+# The setting is read once at import; the tool is either available for the
+# whole process or not at all.
+_REPL_ENABLED: bool = _is_python_repl_enabled()
+
+# The REPL (and langchain_experimental) is only loaded on the first tool call
+repl: Optional["PythonREPL"] = None
+_repl_lock = threading.Lock()
 logger = logging.getLogger(__name__)
 
 
+def _get_repl() -> "PythonREPL":
+    """Return the process-wide PythonREPL, creating it on first use."""
+    global repl
+    if repl is None:
+        with _repl_lock:
+            if repl is None:
+                from langchain_experimental.utilities import PythonREPL
+
+                repl = PythonREPL()
+    return repl
+
+
+# Typical error markers in REPL output, matched in a single pass
+_ERROR_SEARCH = re.compile(r"Error|Exception").search
+
+
 @tool
 @log_io
 def python_repl_tool(
@@ -97,7 +127,7 @@ def python_repl_tool(
     you should print it out with `print(...)`. This is visible to the user."""
 
     # Check if the tool is enabled
-    if not _is_python_repl_enabled():
+    if not _REPL_ENABLED:
         error_msg = "Python REPL tool is disabled. Please enable it in environment configuration."
         logger.warning(error_msg)
         return f"Tool disabled: {error_msg}"
@@ -109,13 +139,15 @@ def python_repl_tool(
 
     logger.info("Executing Python code")
     try:
-        result = repl.run(code)
+        result = _get_repl().run(code)
         # Check if the result is an error message by looking for typical error patterns
-        if isinstance(result, str) and ("Error" in result or "Exception" in result):
+        if isinstance(result, str) and _ERROR_SEARCH(result):
             logger.error(result)
             return f"Error executing code:\n```python\n{code}\n```\nError: {result}"
         logger.info("Code execution successful")
-    except BaseException as e:
+    except (Exception, SystemExit) as e:
+        # SystemExit is caught because the code runs in this process and an
+        # exit() in it must not stop the server; KeyboardInterrupt propagates
         error_msg = repr(e)
         logger.error(error_msg)
         return f"Error executing code:\n```python\n{code}\n```\nError: {error_msg}"
@@ -35,8 +35,17 @@ Tool Functionality:
         - Non-blocking operations for concurrent processing
         - Callback manager integration for monitoring
         
+    Query Cache:
+        - Repeated keyword queries against the same provider and resource set
+          are answered from a bounded in-process LRU
+        - Keys are the exact query text after case folding and whitespace
+          collapsing, so different questions never share results
+        - Entries expire after RETRIEVER_CACHE_TTL seconds (default 600);
+          empty results are not cached
+
     Result Processing:
-        - Document conversion to dictionary format
+        - Documents serialized once to a JSON string (orjson when installed);
+          the string is what the query cache stores and the tool returns
         - Metadata preservation (titles, URLs, descriptions)
         - Content chunking with similarity scores
         - Fallback handling for empty results
@@ -78,6 +87,10 @@ background information from curated document collections.
 """
 
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Optional, Type
 
 from langchain_core.callbacks import (
@@ -87,12 +100,64 @@ from langchain_core.callbacks import (
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from src.deep_research.config.tools import SELECTED_RAG_PROVIDER
-from src.deep_research.rag import Document, Resource, Retriever, build_retriever
+from src.deep_research.config.tools import SELECTED_RAG_PROVIDER_VALUE
+from src.deep_research.rag import Resource, Retriever, build_retriever
+from src.deep_research.rag.retriever import dump_documents
 
 logger = logging.getLogger(__name__)
 
 
+class _QueryCache:
+    """
+    Bounded LRU cache of retriever results with a TTL.
+
+    Entries are keyed by namespace (provider and resource set) and the query
+    text after case folding and whitespace collapsing. Namespaces live inside
+    the keys, so they are evicted with their entries.
+    """
+
+    def __init__(self, capacity: int = 512, ttl_seconds: float = 600):
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        # (namespace, normalized query) -> (monotonic expiry, payload)
+        self._entries: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(namespace: tuple, query: str) -> tuple:
+        return namespace, " ".join(query.casefold().split())
+
+    def get(self, namespace: tuple, query: str) -> str | None:
+        key = self._key(namespace, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, namespace: tuple, query: str, payload: str) -> None:
+        key = self._key(namespace, query)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+
+def _cache_ttl() -> float:
+    try:
+        return float(os.getenv("RETRIEVER_CACHE_TTL", "600"))
+    except ValueError:
+        return 600
+
+
+_query_cache = _QueryCache(ttl_seconds=_cache_ttl())
+
+
 class RetrieverInput(BaseModel):
     keywords: str = Field(description="search keywords to look up")
 
@@ -102,34 +167,62 @@ class RetrieverTool(BaseTool):
     description: str = "Useful for retrieving information from the file with `rag://` uri prefix, it should be higher priority than the web search or writing code. Input should be a search keywords."
     args_schema: Type[BaseModel] = RetrieverInput
 
-    retriever: Retriever = Field(default_factory=Retriever)
+    # Required: Retriever is abstract, so there is no meaningful default
+    retriever: Retriever
     resources: list[Resource] = Field(default_factory=list)
 
     def _run(
         self,
         keywords: str,
         run_manager: Optional[CallbackManagerForToolRun] = None,
-    ) -> list[Document]:
+    ) -> str:
         logger.info(
             f"Retriever tool query: {keywords}", extra={"resources": self.resources}
         )
-        documents = self.retriever.query_relevant_documents(keywords, self.resources)
-        if not documents:
-            return "No results found from the local knowledge base."
-        return [doc.to_dict() for doc in documents]
+        namespace = self._cache_namespace()
+        cached = _query_cache.get(namespace, keywords)
+        if cached is None:
+            documents = self.retriever.query_relevant_documents(
+                keywords, self.resources
+            )
+            if not documents:
+                return "No results found from the local knowledge base."
+            cached = dump_documents(documents).decode()
+            _query_cache.set(namespace, keywords, cached)
+        return cached
 
     async def _arun(
         self,
         keywords: str,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
-    ) -> list[Document]:
-        return self._run(keywords, run_manager.get_sync())
+    ) -> str:
+        logger.info(
+            f"Retriever tool query: {keywords}", extra={"resources": self.resources}
+        )
+        namespace = self._cache_namespace()
+        cached = _query_cache.get(namespace, keywords)
+        if cached is None:
+            documents = await self.retriever.aquery_relevant_documents(
+                keywords, self.resources
+            )
+            if not documents:
+                return "No results found from the local knowledge base."
+            cached = dump_documents(documents).decode()
+            _query_cache.set(namespace, keywords, cached)
+        return cached
+
+    def _cache_namespace(self) -> tuple:
+        # Results are only reusable for the same provider and resource set
+        return (
+            type(self.retriever).__name__,
+            tuple(sorted(resource.uri for resource in self.resources)),
+        )
 
 
 def get_retriever_tool(resources: List[Resource]) -> RetrieverTool | None:
     if not resources:
         return None
-    logger.info(f"create retriever tool: {SELECTED_RAG_PROVIDER}")
+    logger.info(f"create retriever tool: {SELECTED_RAG_PROVIDER_VALUE}")
     retriever = build_retriever()
 
     if not retriever:
@@ -8,13 +8,28 @@ various search providers with configurable parameters and logging integration.
 Key Functions:
     get_search_config(): Configuration loader for search engine settings
         - Loads search configuration from conf.yaml
-        - Returns search engine specific settings
+        - Returns a frozen SearchSettings instance
         - Supports domain filtering and language preferences
+        - Parsed once per load of load_yaml_config's mtime-aware cache;
+          clear_search_config_cache() forces a re-read
         
     get_web_search_tool(max_search_results): Search tool factory function
         - Creates configured search tool based on SELECTED_SEARCH_ENGINE
+        - Dispatches through the _BUILDERS registry (engine -> builder); only
+          engines that use conf.yaml settings read it
         - Applies result limits and provider-specific configurations
+        - Wrapped in BatchingSearchTool: concurrent identical async queries
+          share one request, with a cap on concurrent backend requests
         - Returns LangChain-compatible search tool with logging
+        - Builder for the engine is selected once at import; get_web_search_tool
+          is lru_cached, so there is one shared instance per max_search_results;
+          clear_search_config_cache() also drops these
+
+Key Classes:
+    SearchSettings: Frozen, slotted dataclass for the SEARCH_ENGINE section
+        - include_domains / exclude_domains: tuples (empty if unset)
+        - wikipedia_lang / wikipedia_doc_content_chars_max: defaults applied
+          at parse time, so builders read plain attributes
 
 Supported Search Engines:
     1. Tavily Search (SearchEngine.TAVILY):
@@ -49,9 +64,13 @@ Configuration Features:
     - Content Limits: Character limits for content extraction
     - Result Limits: Configurable maximum results per query
     - API Keys: Secure API key management through environment variables
+      (BRAVE_SEARCH_API_KEY is read once at import; changes need a restart)
 
 Logging Integration:
     - Enhanced Logging: All search tools wrapped with logging decorators
+    - Lazy Loading: LoggedTavilySearch, LoggedDuckDuckGoSearch, ... are module
+      attributes created on first access (PEP 562); an engine's modules are
+      only imported when its tool is used
     - Operation Tracking: Input/output logging for monitoring
     - Performance Monitoring: Search timing and result metrics
     - Error Tracking: Search failures and API errors
@@ -74,101 +93,224 @@ a unified interface, supporting comprehensive research across different
 types of content and sources while maintaining consistent behavior.
 """
 
+import functools
+import importlib
 import logging
 import os
-from typing import List, Optional
-
-from langchain_community.tools import (
-    BraveSearch,
-    DuckDuckGoSearchResults,
-    WikipediaQueryRun,
-)
-from langchain_community.tools.arxiv import ArxivQueryRun
-from langchain_community.utilities import (
-    ArxivAPIWrapper,
-    BraveSearchWrapper,
-    WikipediaAPIWrapper,
-)
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+
+from langchain_core.tools import BaseTool
 
 from src.deep_research.config import SELECTED_SEARCH_ENGINE, SearchEngine, load_yaml_config
+from src.deep_research.config.loader import clear_config_cache
+from src.deep_research.config.tools import SELECTED_SEARCH_ENGINE_VALUE
+from src.deep_research.tools.batching import BatchingSearchTool
 from src.deep_research.tools.decorators import create_logged_tool
-from src.deep_research.tools.tavily_search.tavily_search_results_with_images import (
-    TavilySearchWithImages,
-)
 
 logger = logging.getLogger(__name__)
 
-# Create logged versions of the search tools
-LoggedTavilySearch = create_logged_tool(TavilySearchWithImages)
-LoggedDuckDuckGoSearch = create_logged_tool(DuckDuckGoSearchResults)
-LoggedBraveSearch = create_logged_tool(BraveSearch)
-LoggedArxivSearch = create_logged_tool(ArxivQueryRun)
-LoggedWikipediaSearch = create_logged_tool(WikipediaQueryRun)
+# Logged versions of the search tools, as name -> (module, base class). Each
+# engine pulls in its own client stack, so a class (and its module) is only
+# imported when first used; the default engine never loads the others.
+_LOGGED_TOOLS = {
+    "LoggedTavilySearch": (
+        "src.deep_research.tools.tavily_search.tavily_search_results_with_images",
+        "TavilySearchWithImages",
+    ),
+    "LoggedDuckDuckGoSearch": (
+        "langchain_community.tools",
+        "DuckDuckGoSearchResults",
+    ),
+    "LoggedBraveSearch": ("langchain_community.tools", "BraveSearch"),
+    "LoggedArxivSearch": ("langchain_community.tools.arxiv", "ArxivQueryRun"),
+    "LoggedWikipediaSearch": ("langchain_community.tools", "WikipediaQueryRun"),
+}
 
 
-def get_search_config():
-    config = load_yaml_config("conf.yaml")
-    search_config = config.get("SEARCH_ENGINE", {})
-    return search_config
+@functools.cache
+def _logged_tool(name: str) -> type:
+    module_name, class_name = _LOGGED_TOOLS[name]
+    base = getattr(importlib.import_module(module_name), class_name)
+    return create_logged_tool(base)
 
 
-# Get the selected search tool
-def get_web_search_tool(max_search_results: int):
-    search_config = get_search_config()
+def __getattr__(name: str) -> Any:
+    if name not in _LOGGED_TOOLS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _logged_tool(name)
+    globals()[name] = value
+    return value
 
-    if SELECTED_SEARCH_ENGINE == SearchEngine.TAVILY.value:
-        # Only get and apply include/exclude domains for Tavily
-        include_domains: Optional[List[str]] = search_config.get("include_domains", [])
-        exclude_domains: Optional[List[str]] = search_config.get("exclude_domains", [])
 
-        logger.info(
-            f"Tavily search configuration loaded: include_domains={include_domains}, exclude_domains={exclude_domains}"
-        )
+# Resolved once so a later chdir doesn't change which file is read
+_SEARCH_CONFIG_PATH = os.path.abspath("conf.yaml")
 
-        return LoggedTavilySearch(
-            name="web_search",
-            max_results=max_search_results,
-            include_raw_content=True,
-            include_images=True,
-            include_image_descriptions=True,
-            include_domains=include_domains,
-            exclude_domains=exclude_domains,
-        )
-    elif SELECTED_SEARCH_ENGINE == SearchEngine.DUCKDUCKGO.value:
-        return LoggedDuckDuckGoSearch(
-            name="web_search",
-            num_results=max_search_results,
-        )
-    elif SELECTED_SEARCH_ENGINE == SearchEngine.BRAVE_SEARCH.value:
-        return LoggedBraveSearch(
-            name="web_search",
-            search_wrapper=BraveSearchWrapper(
-                api_key=os.getenv("BRAVE_SEARCH_API_KEY", ""),
-                search_kwargs={"count": max_search_results},
-            ),
-        )
-    elif SELECTED_SEARCH_ENGINE == SearchEngine.ARXIV.value:
-        return LoggedArxivSearch(
-            name="web_search",
-            api_wrapper=ArxivAPIWrapper(
-                top_k_results=max_search_results,
-                load_max_docs=max_search_results,
-                load_all_available_meta=True,
-            ),
-        )
-    elif SELECTED_SEARCH_ENGINE == SearchEngine.WIKIPEDIA.value:
-        wiki_lang = search_config.get("wikipedia_lang", "en")
-        wiki_doc_content_chars_max = search_config.get(
-            "wikipedia_doc_content_chars_max", 4000
-        )
-        return LoggedWikipediaSearch(
-            name="web_search",
-            api_wrapper=WikipediaAPIWrapper(
-                lang=wiki_lang,
-                top_k_results=max_search_results,
-                load_all_available_meta=True,
-                doc_content_chars_max=wiki_doc_content_chars_max,
+# Env-derived settings are frozen at import, like SELECTED_SEARCH_ENGINE;
+# changing them requires a restart.
+_BRAVE_API_KEY = os.getenv("BRAVE_SEARCH_API_KEY", "")
+_WIKI_LANG_DEFAULT = "en"
+_WIKI_DOC_CONTENT_CHARS_MAX_DEFAULT = 4000
+
+
+@dataclass(frozen=True, slots=True)
+class SearchSettings:
+    """SEARCH_ENGINE section of conf.yaml, parsed once per load."""
+
+    include_domains: tuple[str, ...] = ()
+    exclude_domains: tuple[str, ...] = ()
+    wikipedia_lang: str = _WIKI_LANG_DEFAULT
+    wikipedia_doc_content_chars_max: int = _WIKI_DOC_CONTENT_CHARS_MAX_DEFAULT
+
+    @classmethod
+    def from_config(cls, config: dict) -> "SearchSettings":
+        section = config.get("SEARCH_ENGINE") or {}
+        return cls(
+            include_domains=tuple(section.get("include_domains") or ()),
+            exclude_domains=tuple(section.get("exclude_domains") or ()),
+            wikipedia_lang=section.get("wikipedia_lang", _WIKI_LANG_DEFAULT),
+            wikipedia_doc_content_chars_max=int(
+                section.get(
+                    "wikipedia_doc_content_chars_max",
+                    _WIKI_DOC_CONTENT_CHARS_MAX_DEFAULT,
+                )
             ),
         )
-    else:
-        raise ValueError(f"Unsupported search engine: {SELECTED_SEARCH_ENGINE}")
+
+
+# (loaded config dict, settings parsed from it)
+_search_settings: tuple[dict, SearchSettings] | None = None
+
+
+def get_search_config() -> SearchSettings:
+    # load_yaml_config returns the same cached dict until conf.yaml changes, so
+    # the settings are parsed once per load.
+    global _search_settings
+    config = load_yaml_config(_SEARCH_CONFIG_PATH)
+    cached = _search_settings
+    if cached is None or cached[0] is not config:
+        cached = _search_settings = (config, SearchSettings.from_config(config))
+    return cached[1]
+
+
+def clear_search_config_cache() -> None:
+    """Force the next get_search_config() to re-read conf.yaml."""
+    clear_config_cache()
+    get_web_search_tool.cache_clear()
+
+
+# Get the selected search tool
+@functools.lru_cache(maxsize=16)
+def get_web_search_tool(max_search_results: int):
+    # Tools are stateless between calls, so one instance per result limit is
+    # shared by every agent step instead of being rebuilt each time. The
+    # wrapper coalesces identical concurrent queries across those steps.
+    if _SELECTED_BUILDER is None:
+        raise ValueError(f"Unsupported search engine: {SELECTED_SEARCH_ENGINE_VALUE}")
+    return BatchingSearchTool.wrap(_SELECTED_BUILDER(max_search_results))
+
+
+def _build_tavily(max_search_results: int):
+    settings = get_search_config()
+    # Only get and apply include/exclude domains for Tavily
+    include_domains = settings.include_domains
+    exclude_domains = settings.exclude_domains
+
+    logger.info(
+        f"Tavily search configuration loaded: include_domains={include_domains}, exclude_domains={exclude_domains}"
+    )
+
+    return _logged_tool("LoggedTavilySearch")(
+        name="web_search",
+        max_results=max_search_results,
+        include_raw_content=True,
+        include_images=True,
+        include_image_descriptions=True,
+        include_domains=include_domains,
+        exclude_domains=exclude_domains,
+    )
+
+
+def _build_duckduckgo(max_search_results: int):
+    return _logged_tool("LoggedDuckDuckGoSearch")(
+        name="web_search",
+        num_results=max_search_results,
+    )
+
+
+def _build_brave(max_search_results: int):
+    from langchain_community.utilities import BraveSearchWrapper
+
+    return _logged_tool("LoggedBraveSearch")(
+        name="web_search",
+        search_wrapper=BraveSearchWrapper(
+            api_key=_BRAVE_API_KEY,
+            search_kwargs={"count": max_search_results},
+        ),
+    )
+
+
+# The API wrappers run import and environment validators on construction. One
+# validated wrapper per setting is kept, and each result limit gets a shallow
+# model_copy of it (the copy skips validation and shares the client module).
+@functools.cache
+def _arxiv_wrapper():
+    from langchain_community.utilities import ArxivAPIWrapper
+
+    return ArxivAPIWrapper(load_all_available_meta=True)
+
+
+@functools.cache
+def _wikipedia_wrapper(lang: str, doc_content_chars_max: int):
+    from langchain_community.utilities import WikipediaAPIWrapper
+
+    return WikipediaAPIWrapper(
+        lang=lang,
+        load_all_available_meta=True,
+        doc_content_chars_max=doc_content_chars_max,
+    )
+
+
+def _build_arxiv(max_search_results: int):
+    return _logged_tool("LoggedArxivSearch")(
+        name="web_search",
+        api_wrapper=_arxiv_wrapper().model_copy(
+            update={
+                "top_k_results": max_search_results,
+                "load_max_docs": max_search_results,
+            }
+        ),
+    )
+
+
+def _build_wikipedia(max_search_results: int):
+    settings = get_search_config()
+    wrapper = _wikipedia_wrapper(
+        settings.wikipedia_lang, settings.wikipedia_doc_content_chars_max
+    )
+    return _logged_tool("LoggedWikipediaSearch")(
+        name="web_search",
+        api_wrapper=wrapper.model_copy(update={"top_k_results": max_search_results}),
+    )
+
+
+# Engine -> tool builder. Only the Tavily and Wikipedia builders read conf.yaml.
+_BUILDERS: Dict[SearchEngine, Callable[[int], BaseTool]] = {
+    SearchEngine.TAVILY: _build_tavily,
+    SearchEngine.DUCKDUCKGO: _build_duckduckgo,
+    SearchEngine.BRAVE_SEARCH: _build_brave,
+    SearchEngine.ARXIV: _build_arxiv,
+    SearchEngine.WIKIPEDIA: _build_wikipedia,
+}
+
+# Fail at import, not on the first tool call, if an engine has no builder.
+_missing_builders = set(SearchEngine) - _BUILDERS.keys()
+if _missing_builders:
+    raise RuntimeError(
+        f"No search tool builder for: {sorted(e.value for e in _missing_builders)}"
+    )
+
+# The engine is fixed for the process (SELECTED_SEARCH_ENGINE is resolved to a
+# SearchEngine member at import), so the dispatch happens once, here. An
+# unsupported SEARCH_API leaves it None and get_web_search_tool() raises.
+_SELECTED_BUILDER = _BUILDERS.get(SELECTED_SEARCH_ENGINE)
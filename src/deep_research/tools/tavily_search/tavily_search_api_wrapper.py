@@ -1,13 +1,13 @@
 import json
 from typing import Dict, List, Optional
 
-import aiohttp
-import requests
 from langchain_tavily._utilities import TAVILY_API_URL
 from langchain_tavily.tavily_search import (
     TavilySearchAPIWrapper as OriginalTavilySearchAPIWrapper,
 )
 
+from src.deep_research.tools._http import async_client, sync_session
+
 
 class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
     def raw_results(
@@ -34,7 +34,7 @@ class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
             "include_images": include_images,
             "include_image_descriptions": include_image_descriptions,
         }
-        response = requests.post(
+        response = sync_session().post(
             # type: ignore
             f"{TAVILY_API_URL}/search",
             json=params,
@@ -70,13 +70,11 @@ class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
                 "include_images": include_images,
                 "include_image_descriptions": include_image_descriptions,
             }
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.post(f"{TAVILY_API_URL}/search", json=params) as res:
-                    if res.status == 200:
-                        data = await res.text()
-                        return data
-                    else:
-                        raise Exception(f"Error {res.status}: {res.reason}")
+            res = await async_client().post(f"{TAVILY_API_URL}/search", json=params)
+            if res.status_code == 200:
+                return res.text
+            else:
+                raise Exception(f"Error {res.status_code}: {res.reason_phrase}")
 
         results_json_str = await fetch()
         return json.loads(results_json_str)
@@ -23,6 +23,9 @@ Key Functions:
         - Connect to external MCP servers via multiple transports
         - Dynamic tool discovery and metadata retrieval
         - Support for stdio, SSE, and HTTP protocols
+
+    mcp_server_metadata_batch(requests): Concurrent discovery for several servers
+        - One result or error item per server, in request order
         
     rag_config(): RAG system configuration endpoint
         - Current provider information and status
@@ -96,6 +99,8 @@ Middleware and Security:
 Database Integration:
     - PostgreSQL checkpoint support for conversation persistence
     - MongoDB checkpoint support as alternative
+    - The checkpointer (and its connection pool) is opened once in the app
+      lifespan and attached to the graph before requests are served
     - In-memory storage for temporary data
     - Automatic failover and error handling
 
@@ -143,6 +148,13 @@ MCP Integration APIs:
         Authentication: None required (but MCP must be enabled via ENABLE_MCP_SERVER_CONFIGURATION=true)
         Timeout: Configurable, default 300 seconds
 
+    POST /api/mcp/server/metadata/batch
+        Function: mcp_server_metadata_batch(requests: List[MCPServerMetadataRequest])
+        Purpose: Retrieve metadata and tools from several MCP servers concurrently
+        Request: List of MCPServerMetadataRequest
+        Response: List of MCPServerMetadataResponse or MCPServerMetadataError items
+        Authentication: None required (but MCP must be enabled via ENABLE_MCP_SERVER_CONFIGURATION=true)
+
 RAG System APIs:
     GET /api/rag/config
         Function: rag_config()
@@ -151,7 +163,7 @@ RAG System APIs:
         Request: No parameters required
         Response: RAGConfigResponse with provider information
         Authentication: None required
-        Cache: Configuration is cached until server restart
+        Cache: Response is serialized once and cached until server restart
 
     GET /api/rag/resources
         Function: rag_resources(request: RAGResourceRequest)
@@ -161,6 +173,7 @@ RAG System APIs:
         Response: RAGResourcesResponse with list of available resources
         Authentication: None required
         Dependency: Requires configured RAG provider
+        Cache: Results per query are reused for 30 seconds
 
 System Configuration APIs:
     GET /api/config
@@ -170,7 +183,7 @@ System Configuration APIs:
         Request: No parameters required
         Response: ConfigResponse with complete system status
         Authentication: None required
-        Cache: Real-time configuration data
+        Cache: Serialized response reused for up to 60 seconds
 
 System Information APIs:
     GET /
@@ -198,6 +211,8 @@ Streaming and Event Processing:
     _stream_graph_events(): Event streaming from LangGraph workflow execution
     _process_message_chunk(): Individual message chunk processing and formatting
     _make_event(): Server-Sent Events formatting with JSON serialization
+        (orjson when installed, stdlib json for objects it rejects); frames
+        are UTF-8 bytes built from pre-encoded event prefixes
     _process_tool_call_chunks(): Tool call chunk processing and sanitization
 
 Message and Event Handling:
@@ -208,16 +223,25 @@ Message and Event Handling:
 
 System and Configuration:
     custom_openapi(): Enhanced OpenAPI schema generation with custom documentation
+    openapi_json(): Serves the schema as JSON bytes encoded once (orjson if installed)
 
 The server provides a complete API surface for AI-powered research workflows,
 supporting both simple chat interactions and complex multi-step research processes
 with external tool integration and knowledge base access.
 """
 
+import asyncio
 import base64
+import functools
+import gzip
+import hashlib
 import json
 import logging
-from typing import Annotated, List, cast
+import os
+import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Annotated, Any, AsyncIterator, List, Union
 from uuid import uuid4
 
 
@@ -228,16 +252,31 @@ from langgraph.checkpoint.mongodb import AsyncMongoDBSaver
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from psycopg_pool import AsyncConnectionPool
 
+try:
+    import orjson
+except ImportError:  # orjson comes in via langsmith but is not required
+    orjson = None
+
 
 # pure server imports
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.openapi.utils import get_openapi
+from starlette.concurrency import run_in_threadpool
 from src.server.config_request import ConfigResponse
 from src.server.chat_request import ChatRequest, EnhancePromptRequest
-from src.server.mcp_request import MCPServerMetadataRequest, MCPServerMetadataResponse
-from src.server.mcp_utils import load_mcp_tools
+from src.server.mcp_request import (
+    MCPServerMetadataError,
+    MCPServerMetadataRequest,
+    MCPServerMetadataResponse,
+)
+from src.server.mcp_utils import load_mcp_tools_cached
 from src.server.rag_request import (
     RAGConfigResponse,
     RAGResourceRequest,
@@ -247,20 +286,124 @@ from src.server.rag_request import (
 # agent imports
 from src.deep_research.config.configuration import get_recursion_limit, get_bool_env, get_str_env
 from src.deep_research.config.report_style import ReportStyle
-from src.deep_research.config.tools import SELECTED_RAG_PROVIDER
+from src.deep_research.config.tools import SELECTED_RAG_PROVIDER_VALUE
 from src.deep_research.graph.builder import build_graph_with_memory
 from src.deep_research.graph.checkpoint import chat_stream_message
 from src.deep_research.llms.llm import get_configured_llm_models
 from src.deep_research.prompt_enhancer.builder import build_graph as build_prompt_enhancer_graph
 from src.deep_research.rag.builder import build_retriever
 from src.deep_research.rag.retriever import Resource
+from src.deep_research.tools._http import aclose_async_client
 from src.deep_research.utils.json_utils import sanitize_args
 
 logger = logging.getLogger(__name__)
 
 INTERNAL_SERVER_ERROR_DETAIL = "Internal Server Error"
+MCP_SERVER_CONFIGURATION_DISABLED_DETAIL = (
+    "MCP server configuration is disabled. "
+    "Set ENABLE_MCP_SERVER_CONFIGURATION=true to enable MCP features."
+)
+
+# Environment settings read once at import; changing them requires a restart
+MCP_SERVER_CONFIGURATION_ENABLED = get_bool_env(
+    "ENABLE_MCP_SERVER_CONFIGURATION", False
+)
+RECURSION_LIMIT = get_recursion_limit()
+
+
+# SSE frames are built as bytes, so StreamingResponse passes them to the
+# ASGI send without re-encoding. Prefixes for the known event types are
+# encoded once here.
+_EVENT_PREFIXES = {
+    name: f"event: {name}\ndata: ".encode()
+    for name in (
+        "message_chunk",
+        "tool_calls",
+        "tool_call_chunks",
+        "tool_call_result",
+        "interrupt",
+        "error",
+    )
+}
+_SERIALIZATION_ERROR_EVENT = (
+    _EVENT_PREFIXES["error"] + b'{"error":"Serialization failed"}\n\n'
+)
+
+
+def _event_frame(event_type: str, payload: bytes) -> bytes:
+    prefix = _EVENT_PREFIXES.get(event_type)
+    if prefix is None:
+        prefix = f"event: {event_type}\ndata: ".encode()
+    return prefix + payload + b"\n\n"
+
+
+def _dumps_json(data) -> bytes:
+    # orjson is compact UTF-8 by default; objects it rejects (non-str keys,
+    # out-of-range ints, unknown types) go through the stdlib encoder as before.
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+async def _open_checkpointer(stack: AsyncExitStack):
+    """Open the configured checkpoint saver for the lifetime of the server."""
+    checkpoint_saver = get_bool_env("LANGGRAPH_CHECKPOINT_SAVER", False)
+    checkpoint_url = get_str_env("LANGGRAPH_CHECKPOINT_DB_URL", "")
+    if not checkpoint_saver or checkpoint_url == "":
+        return None
+
+    if checkpoint_url.startswith("postgresql://"):
+        logger.info("start async postgres checkpointer.")
+        connection_kwargs = {
+            "autocommit": True,
+            "row_factory": "dict_row",
+            "prepare_threshold": 0,
+        }
+        # One pool for all requests; the saver checks a connection out of it
+        # per operation, and the schema setup runs once.
+        pool = await stack.enter_async_context(
+            AsyncConnectionPool(checkpoint_url, kwargs=connection_kwargs)
+        )
+        checkpointer = AsyncPostgresSaver(pool)
+        await checkpointer.setup()
+        return checkpointer
+
+    if checkpoint_url.startswith("mongodb://"):
+        logger.info("start async mongodb checkpointer.")
+        return await stack.enter_async_context(
+            AsyncMongoDBSaver.from_conn_string(checkpoint_url)
+        )
+
+    return None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the shared RAG provider (and import its client stack) up front. A
+    # misconfigured provider only fails RAG requests, not server startup.
+    try:
+        build_retriever()
+    except Exception as e:
+        logger.warning(f"Failed to initialize the RAG provider at startup: {e}")
+    async with AsyncExitStack() as stack:
+        checkpointer = await _open_checkpointer(stack)
+        if checkpointer is not None:
+            # Attached once, before any request runs, instead of being swapped
+            # onto the shared graph by every chat stream
+            graph.checkpointer = checkpointer
+            graph.store = in_memory_store
+        yield
+    # Release the pooled search connections held for the server's event loop
+    await aclose_async_client()
+
 
 app = FastAPI(
+    lifespan=lifespan,
+    # JSON bodies are encoded with orjson when it is installed
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
     title="DeepResearch API",
     description="""
     ## DeepResearch API
@@ -295,13 +438,131 @@ logger.info(f"Allowed origins: {allowed_origins}")
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Temporarily allow all origins for debugging
-    allow_credentials=True,
+    allow_origins=allowed_origins,
+    # The web client sends no cookies or auth headers cross-origin
+    allow_credentials=False,
     allow_methods=["GET", "POST", "OPTIONS", "PUT", "DELETE"],  # Add more methods
-    allow_headers=["*"],  # Now allow all headers, but can be restricted further
+    # Headers the web client sets on its API requests
+    allow_headers=["Content-Type", "Cache-Control", "Authorization"],
 )
 in_memory_store = InMemoryStore()
 graph = build_graph_with_memory()
+# Compiled once; the enhancer graph keeps no per-request state
+prompt_enhancer_graph = build_prompt_enhancer_graph()
+
+
+@functools.lru_cache(maxsize=8)
+def _etag(body: bytes) -> str:
+    # Bodies are long-lived objects, so each is hashed once
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+# Cached bodies at least this large are also sent gzip-compressed to clients
+# that accept it. They are compressed once per body, not per request; the
+# streaming endpoints are left alone, so no compression middleware is used.
+_GZIP_MIN_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=8)
+def _gzipped(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    # gzip is acceptable when listed (or covered by "*") with a non-zero q-value
+    wildcard_q = None
+    for token in accept_encoding.split(","):
+        coding, _, params = token.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard_q = q
+    return wildcard_q is not None and wildcard_q > 0
+
+
+def _cacheable_json_response(request: Request, body: bytes) -> Response:
+    """Return body as JSON with an ETag, or 304 if the client already has it."""
+    etag = _etag(body)
+    headers = {"Cache-Control": "public, max-age=60", "Vary": "Accept-Encoding"}
+    if len(body) >= _GZIP_MIN_SIZE and _accepts_gzip(
+        request.headers.get("accept-encoding", "")
+    ):
+        # Each encoding is its own representation, with its own strong ETag
+        etag = etag[:-1] + '-gzip"'
+        headers["Content-Encoding"] = "gzip"
+        body = _gzipped(body)
+    headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag
+        in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# The RAG provider is fixed at import, so its config response is serialized once
+_RAG_CONFIG_BODY = (
+    RAGConfigResponse(provider=SELECTED_RAG_PROVIDER_VALUE).model_dump_json().encode()
+)
+
+# /api/config also lists the configured models, which follow conf.yaml; the
+# serialized response is rebuilt at most once per TTL
+_CONFIG_RESPONSE_TTL = 60.0
+_config_response: tuple[float, bytes] | None = None
+
+
+def _config_response_body() -> bytes:
+    global _config_response
+    now = time.monotonic()
+    cached = _config_response
+    if cached is None or now - cached[0] >= _CONFIG_RESPONSE_TTL:
+        body = ConfigResponse(
+            rag=RAGConfigResponse(provider=SELECTED_RAG_PROVIDER_VALUE),
+            models=get_configured_llm_models(),
+        ).model_dump_json().encode()
+        cached = _config_response = (now, body)
+    return cached[1]
+
+
+# Recent /api/rag/resources results, by query; the providers list resources
+# over HTTP, so a short TTL spares repeated lookups from the UI
+_RAG_RESOURCES_TTL = 30.0
+_RAG_RESOURCES_MAX_ENTRIES = 64
+_rag_resources_cache: "OrderedDict[str | None, tuple[float, list[Resource]]]" = (
+    OrderedDict()
+)
+
+
+async def _list_rag_resources(retriever, query: str | None) -> list[Resource]:
+    entry = _rag_resources_cache.get(query)
+    if entry is not None and entry[0] > time.monotonic():
+        _rag_resources_cache.move_to_end(query)
+        return entry[1]
+    # list_resources is a blocking HTTP call; keep it off the event loop
+    resources = await run_in_threadpool(retriever.list_resources, query)
+    _rag_resources_cache[query] = (time.monotonic() + _RAG_RESOURCES_TTL, resources)
+    _rag_resources_cache.move_to_end(query)
+    while len(_rag_resources_cache) > _RAG_RESOURCES_MAX_ENTRIES:
+        _rag_resources_cache.popitem(last=False)
+    return resources
+
+
+# Report styles accepted by /api/prompt/enhance, keyed by upper-cased name
+_PROMPT_REPORT_STYLES = {
+    "ACADEMIC": ReportStyle.ACADEMIC,
+    "POPULAR_SCIENCE": ReportStyle.POPULAR_SCIENCE,
+}
 
 
 @app.post(
@@ -353,14 +614,11 @@ graph = build_graph_with_memory()
     }
 )
 async def chat_stream(request: ChatRequest):
-    # Check if MCP server configuration is enabled
-    mcp_enabled = get_bool_env("ENABLE_MCP_SERVER_CONFIGURATION", False)
-
     # Validate MCP settings if provided
-    if request.mcp_settings and not mcp_enabled:
+    if request.mcp_settings and not MCP_SERVER_CONFIGURATION_ENABLED:
         raise HTTPException(
             status_code=403,
-            detail="MCP server configuration is disabled. Set ENABLE_MCP_SERVER_CONFIGURATION=true to enable MCP features.",
+            detail=MCP_SERVER_CONFIGURATION_DISABLED_DETAIL,
         )
 
     thread_id = request.thread_id
@@ -369,7 +627,8 @@ async def chat_stream(request: ChatRequest):
 
     return StreamingResponse(
         _astream_workflow_generator(
-            request.model_dump()["messages"],
+            # Only the messages need plain dicts; the other fields are passed as is
+            request.model_dump(include={"messages"})["messages"],
             thread_id,
             request.resources,
             request.max_plan_iterations,
@@ -377,7 +636,7 @@ async def chat_stream(request: ChatRequest):
             request.max_search_results,
             request.auto_accepted_plan,
             request.interrupt_feedback,
-            request.mcp_settings if mcp_enabled else {},
+            request.mcp_settings if MCP_SERVER_CONFIGURATION_ENABLED else {},
             request.enable_background_investigation,
             request.report_style,
             request.enable_deep_thinking,
@@ -388,18 +647,16 @@ async def chat_stream(request: ChatRequest):
 
 def _process_tool_call_chunks(tool_call_chunks):
     """Process tool call chunks and sanitize arguments."""
-    chunks = []
-    for chunk in tool_call_chunks:
-        chunks.append(
-            {
-                "name": chunk.get("name", ""),
-                "args": sanitize_args(chunk.get("args", "")),
-                "id": chunk.get("id", ""),
-                "index": chunk.get("index", 0),
-                "type": chunk.get("type", ""),
-            }
-        )
-    return chunks
+    return [
+        {
+            "name": chunk.get("name", ""),
+            "args": sanitize_args(chunk.get("args", "")),
+            "id": chunk.get("id", ""),
+            "index": chunk.get("index", 0),
+            "type": chunk.get("type", ""),
+        }
+        for chunk in tool_call_chunks
+    ]
 
 
 def _get_agent_name(agent, message_metadata):
@@ -425,23 +682,28 @@ def _create_event_stream_message(
         "langgraph_node": message_metadata.get("langgraph_node", ""),
         "langgraph_path": message_metadata.get("langgraph_path", ""),
         "langgraph_step": message_metadata.get("langgraph_step", ""),
-        "content": message_chunk.content,
     }
 
-    # Add optional fields
-    if message_chunk.additional_kwargs.get("reasoning_content"):
-        event_stream_message["reasoning_content"] = message_chunk.additional_kwargs[
-            "reasoning_content"
-        ]
+    # Add optional fields; empty content is left out of the event
+    if (content := message_chunk.content) != "":
+        event_stream_message["content"] = content
 
-    if message_chunk.response_metadata.get("finish_reason"):
-        event_stream_message["finish_reason"] = message_chunk.response_metadata.get(
-            "finish_reason"
-        )
+    if reasoning_content := message_chunk.additional_kwargs.get("reasoning_content"):
+        event_stream_message["reasoning_content"] = reasoning_content
+
+    if finish_reason := message_chunk.response_metadata.get("finish_reason"):
+        event_stream_message["finish_reason"] = finish_reason
 
     return event_stream_message
 
 
+# Choices offered with every plan interrupt; only ever serialized, never mutated
+_INTERRUPT_OPTIONS = (
+    {"text": "Edit plan", "value": "edit_plan"},
+    {"text": "Start research", "value": "accepted"},
+)
+
+
 def _create_interrupt_event(thread_id, event_data):
     """Create interrupt event."""
     interrupt_obj = event_data["__interrupt__"][0]
@@ -464,69 +726,91 @@ def _create_interrupt_event(thread_id, event_data):
         interrupt_id = "interrupt"
         interrupt_value = str(interrupt_obj)
     
-    return _make_event(
-        "interrupt",
-        {
-            "thread_id": thread_id,
-            "id": interrupt_id,
-            "role": "assistant",
-            "content": interrupt_value,
-            "finish_reason": "interrupt",
-            "options": [
-                {"text": "Edit plan", "value": "edit_plan"},
-                {"text": "Start research", "value": "accepted"},
-            ],
-        },
-    )
+    event_data = {
+        "thread_id": thread_id,
+        "id": interrupt_id,
+        "role": "assistant",
+        "content": interrupt_value,
+        "finish_reason": "interrupt",
+        "options": _INTERRUPT_OPTIONS,
+    }
+    if interrupt_value == "":
+        del event_data["content"]
+    return _make_event("interrupt", event_data)
 
 
 def _process_initial_messages(message, thread_id):
     """Process initial messages and yield formatted events."""
-    json_data = json.dumps(
+    json_data = _dumps_json(
         {
             "thread_id": thread_id,
-            "id": "run--" + message.get("id", uuid4().hex),
+            # Cosmetic run id; the random fallback is only generated when the
+            # message has no id (os.urandom hex, same format as uuid4().hex)
+            "id": "run--" + (message["id"] if "id" in message else os.urandom(16).hex()),
             "role": "user",
             "content": message.get("content", ""),
-        },
-        ensure_ascii=False,
-        separators=(",", ":"),
-    )
-    chat_stream_message(
-        thread_id, f"event: message_chunk\ndata: {json_data}\n\n", "none"
+        }
     )
+    chat_stream_message(thread_id, _event_frame("message_chunk", json_data), "none")
+
+
+def _tool_message_event(message_chunk, event_stream_message) -> bytes:
+    # Tool Message - Return the result of the tool call
+    event_stream_message["tool_call_id"] = message_chunk.tool_call_id
+    return _make_event("tool_call_result", event_stream_message)
+
+
+def _ai_message_event(message_chunk, event_stream_message) -> bytes:
+    tool_call_chunks = message_chunk.tool_call_chunks
+    if tool_calls := message_chunk.tool_calls:
+        # AI Message - Tool Call
+        event_stream_message["tool_calls"] = tool_calls
+        event_stream_message["tool_call_chunks"] = _process_tool_call_chunks(
+            tool_call_chunks
+        )
+        return _make_event("tool_calls", event_stream_message)
+    if tool_call_chunks:
+        # AI Message - Tool Call Chunks
+        event_stream_message["tool_call_chunks"] = _process_tool_call_chunks(
+            tool_call_chunks
+        )
+        return _make_event("tool_call_chunks", event_stream_message)
+    # AI Message - Raw message tokens
+    return _make_event("message_chunk", event_stream_message)
+
+
+# Event builder per message class, looked up by exact type. Subclasses are
+# resolved with isinstance on first sight and added to the table.
+_MESSAGE_EVENT_HANDLERS = {
+    ToolMessage: _tool_message_event,
+    AIMessageChunk: _ai_message_event,
+}
+
+
+def _message_event_handler(message_type: type):
+    handler = _MESSAGE_EVENT_HANDLERS.get(message_type)
+    if handler is None:
+        for base in (ToolMessage, AIMessageChunk):
+            if issubclass(message_type, base):
+                handler = _MESSAGE_EVENT_HANDLERS[base]
+                break
+        else:
+            # Other message types produce no event
+            handler = False
+        _MESSAGE_EVENT_HANDLERS[message_type] = handler
+    return handler
 
 
 async def _process_message_chunk(message_chunk, message_metadata, thread_id, agent):
     """Process a single message chunk and yield appropriate events."""
+    handler = _message_event_handler(type(message_chunk))
+    if not handler:
+        return
     agent_name = _get_agent_name(agent, message_metadata)
     event_stream_message = _create_event_stream_message(
         message_chunk, message_metadata, thread_id, agent_name
     )
-
-    if isinstance(message_chunk, ToolMessage):
-        # Tool Message - Return the result of the tool call
-        event_stream_message["tool_call_id"] = message_chunk.tool_call_id
-        yield _make_event("tool_call_result", event_stream_message)
-    elif isinstance(message_chunk, AIMessageChunk):
-        # AI Message - Raw message tokens
-        if message_chunk.tool_calls:
-            # AI Message - Tool Call
-            event_stream_message["tool_calls"] = message_chunk.tool_calls
-            event_stream_message["tool_call_chunks"] = message_chunk.tool_call_chunks
-            event_stream_message["tool_call_chunks"] = _process_tool_call_chunks(
-                message_chunk.tool_call_chunks
-            )
-            yield _make_event("tool_calls", event_stream_message)
-        elif message_chunk.tool_call_chunks:
-            # AI Message - Tool Call Chunks
-            event_stream_message["tool_call_chunks"] = _process_tool_call_chunks(
-                message_chunk.tool_call_chunks
-            )
-            yield _make_event("tool_call_chunks", event_stream_message)
-        else:
-            # AI Message - Raw message tokens
-            yield _make_event("message_chunk", event_stream_message)
+    yield handler(message_chunk, event_stream_message)
 
 
 async def _stream_graph_events(
@@ -544,9 +828,11 @@ async def _stream_graph_events(
                 yield _create_interrupt_event(thread_id, event_data)
             continue
 
-        message_chunk, message_metadata = cast(
-            tuple[BaseMessage, dict[str, any]], event_data
-        )
+        # Local annotations are not evaluated at runtime, unlike cast()'s
+        # subscripted type argument
+        message_chunk: BaseMessage
+        message_metadata: dict[str, Any]
+        message_chunk, message_metadata = event_data
 
         async for event in _process_message_chunk(
             message_chunk, message_metadata, thread_id, agent
@@ -601,71 +887,30 @@ async def _astream_workflow_generator(
         "mcp_settings": mcp_settings,
         "report_style": report_style.value,
         "enable_deep_thinking": enable_deep_thinking,
-        "recursion_limit": get_recursion_limit(),
+        "recursion_limit": RECURSION_LIMIT,
     }
 
-    checkpoint_saver = get_bool_env("LANGGRAPH_CHECKPOINT_SAVER", False)
-    checkpoint_url = get_str_env("LANGGRAPH_CHECKPOINT_DB_URL", "")
-    # Handle checkpointer if configured
-    connection_kwargs = {
-        "autocommit": True,
-        "row_factory": "dict_row",
-        "prepare_threshold": 0,
-    }
-    if checkpoint_saver and checkpoint_url != "":
-        if checkpoint_url.startswith("postgresql://"):
-            logger.info("start async postgres checkpointer.")
-            async with AsyncConnectionPool(
-                checkpoint_url, kwargs=connection_kwargs
-            ) as conn:
-                checkpointer = AsyncPostgresSaver(conn)
-                await checkpointer.setup()
-                graph.checkpointer = checkpointer
-                graph.store = in_memory_store
-                async for event in _stream_graph_events(
-                    graph, workflow_input, workflow_config, thread_id
-                ):
-                    yield event
-
-        if checkpoint_url.startswith("mongodb://"):
-            logger.info("start async mongodb checkpointer.")
-            async with AsyncMongoDBSaver.from_conn_string(
-                checkpoint_url
-            ) as checkpointer:
-                graph.checkpointer = checkpointer
-                graph.store = in_memory_store
-                async for event in _stream_graph_events(
-                    graph, workflow_input, workflow_config, thread_id
-                ):
-                    yield event
-    else:
-        # Use graph without MongoDB checkpointer
-        async for event in _stream_graph_events(
-            graph, workflow_input, workflow_config, thread_id
-        ):
-            yield event
+    # The checkpointer (if configured) was attached to the graph at startup
+    async for event in _stream_graph_events(
+        graph, workflow_input, workflow_config, thread_id
+    ):
+        yield event
 
 
-def _make_event(event_type: str, data: dict[str, any]):
-    if data.get("content") == "":
-        data.pop("content")
+def _make_event(event_type: str, data: dict[str, Any]) -> bytes:
+    # Callers leave out empty "content" when building data
     # Ensure JSON serialization with proper encoding
     try:
-        json_data = json.dumps(data, ensure_ascii=False)
+        event = _event_frame(event_type, _dumps_json(data))
 
         finish_reason = data.get("finish_reason", "")
-        chat_stream_message(
-            data.get("thread_id", ""),
-            f"event: {event_type}\ndata: {json_data}\n\n",
-            finish_reason,
-        )
+        chat_stream_message(data.get("thread_id", ""), event, finish_reason)
 
-        return f"event: {event_type}\ndata: {json_data}\n\n"
+        return event
     except (TypeError, ValueError) as e:
         logger.error(f"Error serializing event data: {e}")
         # Return a safe error event
-        error_data = json.dumps({"error": "Serialization failed"}, ensure_ascii=False)
-        return f"event: error\ndata: {error_data}\n\n"
+        return _SERIALIZATION_ERROR_EVENT
 
 
 @app.post(
@@ -718,26 +963,15 @@ async def enhance_prompt(request: EnhancePromptRequest):
         sanitized_prompt = request.prompt.replace("\r\n", "").replace("\n", "")
         logger.info(f"Enhancing prompt: {sanitized_prompt}")
 
-        # Convert string report_style to ReportStyle enum
-        report_style = None
-        if request.report_style:
-            try:
-                # Handle both uppercase and lowercase input
-                style_mapping = {
-                    "ACADEMIC": ReportStyle.ACADEMIC,
-                    "POPULAR_SCIENCE": ReportStyle.POPULAR_SCIENCE,
-                }
-                report_style = style_mapping.get(
-                    request.report_style.upper(), ReportStyle.ACADEMIC
-                )
-            except Exception:
-                # If invalid style, default to ACADEMIC
-                report_style = ReportStyle.ACADEMIC
-        else:
-            report_style = ReportStyle.ACADEMIC
+        # Convert string report_style to ReportStyle enum (case-insensitive);
+        # missing or unknown styles default to ACADEMIC
+        report_style = _PROMPT_REPORT_STYLES.get(
+            (request.report_style or "").upper(), ReportStyle.ACADEMIC
+        )
 
-        workflow = build_prompt_enhancer_graph()
-        final_state = workflow.invoke(
+        # ainvoke runs the sync enhancer node in a worker thread, so the LLM
+        # call no longer blocks the event loop
+        final_state = await prompt_enhancer_graph.ainvoke(
             {
                 "prompt": request.prompt,
                 "context": request.context,
@@ -814,48 +1048,144 @@ async def enhance_prompt(request: EnhancePromptRequest):
 async def mcp_server_metadata(request: MCPServerMetadataRequest):
     """Get information about an MCP server."""
     # Check if MCP server configuration is enabled
-    if not get_bool_env("ENABLE_MCP_SERVER_CONFIGURATION", False):
+    if not MCP_SERVER_CONFIGURATION_ENABLED:
         raise HTTPException(
             status_code=403,
-            detail="MCP server configuration is disabled. Set ENABLE_MCP_SERVER_CONFIGURATION=true to enable MCP features.",
+            detail=MCP_SERVER_CONFIGURATION_DISABLED_DETAIL,
         )
 
     try:
-        # Set default timeout with a longer value for this endpoint
-        timeout = 300  # Default to 300 seconds for this endpoint
-
-        # Use custom timeout from request if provided
-        if request.timeout_seconds is not None:
-            timeout = request.timeout_seconds
-
-        # Load tools from the MCP server using the utility function
-        tools = await load_mcp_tools(
-            server_type=request.transport,
-            command=request.command,
-            args=request.args,
-            url=request.url,
-            env=request.env,
-            headers=request.headers,
-            timeout_seconds=timeout,
-        )
-
-        # Create the response with tools
-        response = MCPServerMetadataResponse(
-            transport=request.transport,
-            command=request.command,
-            args=request.args,
-            url=request.url,
-            env=request.env,
-            headers=request.headers,
-            tools=tools,
+        tools = await _load_server_tools(request)
+        if len(tools) >= _MCP_STREAM_MIN_TOOLS:
+            head = _mcp_metadata_response(request, []).model_dump_json().encode()
+            # Streaming splices the tools into the trailing empty list, so it
+            # only works while tools is the last field of the response model
+            if head.endswith(b"[]}"):
+                return StreamingResponse(
+                    _stream_mcp_metadata(head, tools),
+                    media_type="application/json",
+                )
+            logger.warning("MCP metadata tools field is not last; not streaming")
+        response = _mcp_metadata_response(request, tools)
+        return Response(
+            content=response.model_dump_json(), media_type="application/json"
         )
-
-        return response
     except Exception as e:
         logger.exception(f"Error in MCP server metadata endpoint: {str(e)}")
         raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
 
 
+async def _load_server_tools(request: MCPServerMetadataRequest) -> list:
+    # Default to 300 seconds for the metadata endpoints; the request can override
+    timeout = 300
+    if request.timeout_seconds is not None:
+        timeout = request.timeout_seconds
+
+    # Load tools from the MCP server using the utility function
+    return await load_mcp_tools_cached(
+        server_type=request.transport,
+        command=request.command,
+        args=request.args,
+        url=request.url,
+        env=request.env,
+        headers=request.headers,
+        timeout_seconds=timeout,
+    )
+
+
+def _mcp_metadata_response(
+    request: MCPServerMetadataRequest, tools: list
+) -> MCPServerMetadataResponse:
+    # The fields come from the validated request, so the model is built without
+    # re-validation and encoded by pydantic-core directly (FastAPI would
+    # validate and encode it again)
+    return MCPServerMetadataResponse.model_construct(
+        transport=request.transport,
+        command=request.command,
+        args=request.args,
+        url=request.url,
+        env=request.env,
+        headers=request.headers,
+        tools=tools,
+    )
+
+
+@app.post(
+    "/api/mcp/server/metadata/batch",
+    response_model=List[Union[MCPServerMetadataResponse, MCPServerMetadataError]],
+    tags=["MCP Integration"],
+    summary="Get Metadata and Tools for Several MCP Servers",
+    description="""
+    **Retrieve metadata and tools from several MCP servers in one request.**
+
+    Takes a list of the same server descriptions as `/api/mcp/server/metadata`
+    and queries the servers concurrently, so the request takes about as long as
+    the slowest server rather than the sum of all of them.
+
+    ### Response:
+    One item per requested server, in request order: either the server metadata
+    with its tools, or an error item naming the server and what went wrong.
+    A failing server does not fail the whole batch.
+
+    ### Security Note:
+    MCP server configuration must be explicitly enabled via environment variable:
+    `ENABLE_MCP_SERVER_CONFIGURATION=true`
+    """,
+    response_description="Metadata or an error item for each requested MCP server",
+    responses={
+        403: {"description": "MCP server configuration is disabled"},
+    },
+)
+async def mcp_server_metadata_batch(requests: List[MCPServerMetadataRequest]):
+    """Get information about several MCP servers concurrently."""
+    if not MCP_SERVER_CONFIGURATION_ENABLED:
+        raise HTTPException(
+            status_code=403,
+            detail=MCP_SERVER_CONFIGURATION_DISABLED_DETAIL,
+        )
+
+    # Loads share the tool cache and its concurrency limit with the single
+    # server endpoint
+    results = await asyncio.gather(
+        *(_load_server_tools(request) for request in requests),
+        return_exceptions=True,
+    )
+
+    items = []
+    for request, result in zip(requests, results):
+        if not isinstance(result, BaseException):
+            items.append(_mcp_metadata_response(request, result))
+            continue
+        if isinstance(result, HTTPException) and result.status_code < 500:
+            error = result.detail
+        else:
+            logger.error(f"Error loading MCP server metadata in batch: {result}")
+            error = INTERNAL_SERVER_ERROR_DETAIL
+        items.append(
+            MCPServerMetadataError(
+                transport=request.transport,
+                command=request.command,
+                url=request.url,
+                error=error,
+            )
+        )
+    body = b",".join(item.model_dump_json().encode() for item in items)
+    return Response(content=b"[" + body + b"]", media_type="application/json")
+
+
+# Tool catalogs at least this large are streamed one tool at a time, so the
+# whole response body is never held in memory next to the tools
+_MCP_STREAM_MIN_TOOLS = 32
+
+
+async def _stream_mcp_metadata(head: bytes, tools: list) -> AsyncIterator[bytes]:
+    # head is the response encoded with an empty tools list, the last field
+    yield head[:-2]
+    for i, tool in enumerate(tools):
+        yield (b"," if i else b"") + tool.model_dump_json().encode()
+    yield b"]}"
+
+
 @app.get(
     "/api/rag/config", 
     response_model=RAGConfigResponse,
@@ -903,9 +1233,9 @@ async def mcp_server_metadata(request: MCPServerMetadataRequest):
         500: {"description": "Internal server error"}
     }
 )
-async def rag_config():
+async def rag_config(request: Request):
     """Get the config of the RAG."""
-    return RAGConfigResponse(provider=SELECTED_RAG_PROVIDER)
+    return _cacheable_json_response(request, _RAG_CONFIG_BODY)
 
 
 @app.get(
@@ -970,9 +1300,16 @@ async def rag_config():
 async def rag_resources(request: Annotated[RAGResourceRequest, Query()]):
     """Get the resources of the RAG."""
     retriever = build_retriever()
-    if retriever:
-        return RAGResourcesResponse(resources=retriever.list_resources(request.query))
-    return RAGResourcesResponse(resources=[])
+    resources = (
+        await _list_rag_resources(retriever, request.query) if retriever else []
+    )
+    # Resources are already validated models; encode without a second pass
+    return Response(
+        content=RAGResourcesResponse.model_construct(
+            resources=resources
+        ).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @app.get(
@@ -1044,12 +1381,9 @@ async def rag_resources(request: Annotated[RAGResourceRequest, Query()]):
         500: {"description": "Internal server error"}
     }
 )
-async def config():
+async def config(request: Request):
     """Get the config of the server."""
-    return ConfigResponse(
-        rag=RAGConfigResponse(provider=SELECTED_RAG_PROVIDER),
-        models=get_configured_llm_models(),
-    )
+    return _cacheable_json_response(request, _config_response_body())
 
 
 @app.get(
@@ -1102,22 +1436,29 @@ async def config():
         }
     }
 )
-async def root():
+async def root(request: Request):
     """Root endpoint with API information."""
-    return {
+    return _cacheable_json_response(request, _ROOT_BODY)
+
+
+# / and /health return fixed payloads, serialized once
+_ROOT_BODY = _dumps_json(
+    {
         "message": "DeepResearch API",
         "version": "0.1.0",
         "docs": "/docs",
         "redoc": "/redoc",
         "endpoints": {
             "chat_stream": "/api/chat/stream",
-            "prompt_enhance": "/api/prompt/enhance", 
+            "prompt_enhance": "/api/prompt/enhance",
             "mcp_metadata": "/api/mcp/server/metadata",
             "rag_config": "/api/rag/config",
             "rag_resources": "/api/rag/resources",
-            "config": "/api/config"
-        }
+            "config": "/api/config",
+        },
     }
+)
+_HEALTH_BODY = _dumps_json({"status": "healthy", "timestamp": "2025-08-27"})
 
 
 @app.get(
@@ -1162,7 +1503,7 @@ async def root():
 )
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": "2025-08-27"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 def custom_openapi():
@@ -1272,3 +1613,25 @@ For questions, issues, or feature requests, please visit our GitHub repository.
 
 # Override the default OpenAPI schema
 app.openapi = custom_openapi
+
+
+def _openapi_json_bytes() -> bytes:
+    """Return the OpenAPI schema serialized once, on first request."""
+    body = getattr(app.state, "openapi_bytes", None)
+    if body is None:
+        body = app.state.openapi_bytes = _dumps_json(app.openapi())
+    return body
+
+
+async def openapi_json(request: Request) -> Response:
+    return _cacheable_json_response(request, _openapi_json_bytes())
+
+
+# FastAPI's own /openapi.json route re-encodes the schema dict on every hit;
+# swap it for one that serves the cached bytes (/docs and /redoc load it too)
+app.router.routes[:] = [
+    route
+    for route in app.router.routes
+    if getattr(route, "path", None) != app.openapi_url
+]
+app.add_route(app.openapi_url, openapi_json, include_in_schema=False)
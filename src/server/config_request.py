@@ -12,7 +12,7 @@ Used by the /api/config endpoint to return complete system status and configurat
 information for client applications and monitoring systems.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.server.rag_request import RAGConfigResponse
 
@@ -20,5 +20,7 @@ from src.server.rag_request import RAGConfigResponse
 class ConfigResponse(BaseModel):
     """Response model for server config."""
 
+    model_config = ConfigDict(frozen=True)
+
     rag: RAGConfigResponse = Field(..., description="The config of the RAG")
     models: dict[str, list[str]] = Field(..., description="The configured models")
@@ -7,8 +7,11 @@ and tools in a standardized way, supporting multiple transport methods and serve
 
 Classes:
     MCPServerMetadataRequest: Request model for connecting to MCP servers
-    MCPTool: Individual tool definition from MCP server
     MCPServerMetadataResponse: Response model containing server metadata and tools
+        (tools are mcp.types.Tool definitions from the MCP server)
+    MCPServerMetadataError: Per-server error item in batch metadata responses
+
+All models are frozen (immutable once validated).
 
 Supports multiple transport protocols:
 - stdio: Standard input/output based servers
@@ -20,12 +23,15 @@ Used for dynamic tool discovery and integration with external MCP-compatible ser
 
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from mcp.types import Tool
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MCPServerMetadataRequest(BaseModel):
     """Request model for MCP server metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     transport: str = Field(
         ...,
         description=(
@@ -55,6 +61,8 @@ class MCPServerMetadataRequest(BaseModel):
 class MCPServerMetadataResponse(BaseModel):
     """Response model for MCP server metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     transport: str = Field(
         ...,
         description=(
@@ -76,6 +84,26 @@ class MCPServerMetadataResponse(BaseModel):
     headers: Optional[Dict[str, str]] = Field(
         None, description="HTTP headers (for sse/streamable_http type)"
     )
-    tools: List = Field(
+    tools: List[Tool] = Field(
         default_factory=list, description="Available tools from the MCP server"
     )
+
+
+class MCPServerMetadataError(BaseModel):
+    """Error item for a server that failed in a batch metadata request."""
+
+    model_config = ConfigDict(frozen=True)
+
+    transport: str = Field(
+        ...,
+        description=(
+            "The type of MCP server connection (stdio or sse or streamable_http)"
+        ),
+    )
+    command: Optional[str] = Field(
+        None, description="The command to execute (for stdio type)"
+    )
+    url: Optional[str] = Field(
+        None, description="The URL of the SSE server (for sse type)"
+    )
+    error: str = Field(..., description="Why the server's tools could not be loaded")
@@ -7,6 +7,11 @@ and manages tool discovery and loading from external MCP-compatible services.
 
 Functions:
     load_mcp_tools: Main function to connect to MCP servers and load available tools
+    load_mcp_tools_cached: load_mcp_tools behind an LRU cache with a TTL
+        - Keyed by transport, command, args, url, env and headers
+        - Concurrent misses for the same server share one load
+        - Failed loads are not cached
+        - At most MCP_MAX_CONCURRENCY (env, default 8) loads run at once
     _create_stdio_session: Create stdio-based MCP client session
     _create_sse_session: Create Server-Sent Events based MCP client session  
     _create_http_session: Create HTTP streaming based MCP client session
@@ -17,7 +22,13 @@ MCP server implementations. Includes error handling, timeout management, and
 tool metadata extraction for seamless integration with the AI system.
 """
 
+import asyncio
+import functools
 import logging
+import os
+import time
+import weakref
+from collections import OrderedDict
 from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
@@ -29,6 +40,29 @@ from mcp.client.streamable_http import streamablehttp_client
 
 logger = logging.getLogger(__name__)
 
+# Tool listings are reused for this long, for at most this many servers
+_TOOLS_CACHE_TTL = 300.0
+_TOOLS_CACHE_MAX_ENTRIES = 128
+
+# server key -> (expiry on the monotonic clock, tools), least recently used first
+_tools_cache: "OrderedDict[tuple, tuple[float, List]]" = OrderedDict()
+# server key -> load in progress, awaited by every concurrent caller
+_tools_in_flight: Dict[tuple, asyncio.Future] = {}
+
+# Caps the stdio processes and server connections opened for distinct servers
+# at any one time; read once at import
+_MAX_CONCURRENCY = int(os.getenv("MCP_MAX_CONCURRENCY", "8"))
+# One limit per event loop, created inside the loop on first use
+_load_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _load_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _load_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _load_semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENCY)
+    return semaphore
+
 
 async def _get_tools_from_client_session(
     client_context_manager: Any, timeout_seconds: int = 10
@@ -131,3 +165,65 @@ async def load_mcp_tools(
             logger.exception(f"Error loading MCP tools: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
         raise
+
+
+async def load_mcp_tools_cached(
+    server_type: str,
+    command: Optional[str] = None,
+    args: Optional[List[str]] = None,
+    url: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout_seconds: int = 60,
+) -> List:
+    """
+    Load tools from an MCP server, reusing a recent listing for the same server.
+
+    Takes the same arguments as load_mcp_tools. The timeout is not part of the
+    cache key.
+    """
+    key = (
+        server_type,
+        command,
+        tuple(args or ()),
+        url,
+        tuple(sorted((env or {}).items())),
+        tuple(sorted((headers or {}).items())),
+    )
+    entry = _tools_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        _tools_cache.move_to_end(key)
+        return entry[1]
+
+    task = _tools_in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _load_mcp_tools_bounded(
+                server_type=server_type,
+                command=command,
+                args=args,
+                url=url,
+                env=env,
+                headers=headers,
+                timeout_seconds=timeout_seconds,
+            )
+        )
+        _tools_in_flight[key] = task
+        task.add_done_callback(functools.partial(_store_tools, key))
+    # Shielded so one caller disconnecting does not cancel the shared load
+    return await asyncio.shield(task)
+
+
+async def _load_mcp_tools_bounded(**kwargs) -> List:
+    async with _load_semaphore():
+        return await load_mcp_tools(**kwargs)
+
+
+def _store_tools(key: tuple, task: asyncio.Future) -> None:
+    _tools_in_flight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    _tools_cache[key] = (time.monotonic() + _TOOLS_CACHE_TTL, task.result())
+    _tools_cache.move_to_end(key)
+    while len(_tools_cache) > _TOOLS_CACHE_MAX_ENTRIES:
+        _tools_cache.popitem(last=False)
@@ -14,7 +14,7 @@ The RAG system supports multiple providers and enables semantic search across
 various knowledge sources including documents, web pages, and databases.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.deep_research.rag.retriever import Resource
 
@@ -22,6 +22,8 @@ from src.deep_research.rag.retriever import Resource
 class RAGConfigResponse(BaseModel):
     """Response model for RAG config."""
 
+    model_config = ConfigDict(frozen=True)
+
     provider: str | None = Field(
         None, description="The provider of the RAG, default is ragflow"
     )
@@ -30,6 +32,8 @@ class RAGConfigResponse(BaseModel):
 class RAGResourceRequest(BaseModel):
     """Request model for RAG resource."""
 
+    model_config = ConfigDict(frozen=True)
+
     query: str | None = Field(
         None, description="The query of the resource need to be searched"
     )
@@ -38,4 +42,6 @@ class RAGResourceRequest(BaseModel):
 class RAGResourcesResponse(BaseModel):
     """Response model for RAG resources."""
 
+    model_config = ConfigDict(frozen=True)
+
     resources: list[Resource] = Field(..., description="The resources of the RAG")
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+from src.deep_research.graph.checkpoint import ChatStreamManager
+
+
+def _manager_with_slow_writer(written: list, release: threading.Event):
+    manager = ChatStreamManager(checkpoint_saver=False)
+    # Pretend a database is configured; the write blocks until released
+    manager.checkpoint_saver = True
+    manager.mongo_db = object()
+
+    def persist(thread_id, messages):
+        release.wait(timeout=5)
+        written.append((thread_id, messages))
+        return True
+
+    manager._persist_to_mongodb = persist
+    return manager
+
+
+def test_write_from_event_loop_returns_future():
+    written: list = []
+    release = threading.Event()
+    manager = _manager_with_slow_writer(written, release)
+
+    async def stream():
+        manager.process_stream_message("thread-1", "hello", "none")
+        return manager.process_stream_message("thread-1", "world", "stop")
+
+    result = asyncio.run(stream())
+    assert isinstance(result, Future)
+    assert not result.done()
+
+    release.set()
+    assert result.result(timeout=5) is True
+    manager.close()
+
+
+def test_close_drains_queued_writes():
+    written: list = []
+    release = threading.Event()
+    manager = _manager_with_slow_writer(written, release)
+
+    async def stream():
+        futures = []
+        for thread_id in ("thread-1", "thread-2"):
+            manager.process_stream_message(thread_id, "hello", "none")
+            futures.append(manager.process_stream_message(thread_id, "bye", "stop"))
+        return futures
+
+    futures = asyncio.run(stream())
+    assert written == []
+
+    release.set()
+    manager.close()
+
+    assert all(future.done() for future in futures)
+    assert written == [
+        ("thread-1", ["hello", "bye"]),
+        ("thread-2", ["hello", "bye"]),
+    ]
+
+
+def test_cursor_dropped_when_stream_ends():
+    written: list = []
+    release = threading.Event()
+    release.set()
+    manager = _manager_with_slow_writer(written, release)
+
+    manager.process_stream_message("thread-1", "hello", "none")
+    manager.process_stream_message("thread-1", "question", "interrupt")
+    assert manager._cursors == {}
+
+    # Resuming the thread appends to the chunks stored before the interrupt
+    manager.process_stream_message("thread-1", "answer", "stop")
+    assert manager._cursors == {}
+    assert written[-1] == ("thread-1", ["hello", "question", "answer"])
+    manager.close()